@@ -5,6 +5,7 @@ import argparse
 import inspect
 import json
 import os
+import shlex
 import sys
 from dataclasses import is_dataclass
 from typing import Any, Callable, Dict, Optional, Sequence
@@ -186,6 +187,9 @@ def build_parser() -> argparse.ArgumentParser:
     r.add_argument("--timeout-s", type=int, default=240, help="Timeout per command")
     r.add_argument("--log-dir", default=None, help="Log directory (relative to project or absolute)")
     r.add_argument("--json-summary", action="store_true", help="Write summary.json alongside summary.txt")
+    r.add_argument("--json-compact", action="store_true", help="Write summary.json without indentation")
+    r.add_argument("--parallel-cmds", action="store_true", help="Run generic-shell --cmd entries concurrently")
+    r.add_argument("--no-fail-fast", action="store_true", help="Keep running generic-shell --cmd entries after a failure")
     r.set_defaults(func=run_run)
 
     f = sub.add_parser("fix", help="Run auto-fix loop with plans")
@@ -346,7 +350,7 @@ def run_run(args: argparse.Namespace) -> int:
     else:
         log_dir = project_dir / ".archmind" / "run_logs"
 
-    command = "archmind " + " ".join(getattr(args, "_argv", []))
+    command = "archmind " + shlex.join(getattr(args, "_argv", []))
     ensure_environment_readiness(project_dir)
     set_agent_state(project_dir, "RUNNING", action=command.strip(), summary="run started")
     config = RunConfig(
@@ -361,6 +365,9 @@ def run_run(args: argparse.Namespace) -> int:
         command=command.strip(),
         profile=args.profile,
         cmds=args.cmd,
+        json_summary_indent=not args.json_compact,
+        parallel_cmds=args.parallel_cmds,
+        fail_fast=not args.no_fail_fast,
     )
 
     result = run_pipeline(config)
@@ -402,7 +409,7 @@ def run_fix(args: argparse.Namespace) -> int:
         print("[ERROR] --profile generic-shell requires at least one --cmd.", file=sys.stderr)
         return 64
 
-    command = "archmind " + " ".join(getattr(args, "_argv", []))
+    command = "archmind " + shlex.join(getattr(args, "_argv", []))
     try:
         set_agent_state(project_dir, "FIXING", action=command.strip(), summary="fix started")
         exit_code = run_fix_loop(
@@ -478,7 +485,7 @@ def run_deploy(args: argparse.Namespace) -> int:
         print(f"[ERROR] Path is not a directory: {project_dir}", file=sys.stderr)
         return 64
 
-    command = "archmind " + " ".join(getattr(args, "_argv", []))
+    command = "archmind " + shlex.join(getattr(args, "_argv", []))
     result = deploy_project(
         project_dir=project_dir,
         target=args.target,
@@ -24,6 +24,10 @@ def get_local_model(default: str = "llama3:latest") -> str:
     return _read_env("ARCHMIND_LOCAL_MODEL", default) or default
 
 
+def get_local_keep_alive(default: str = "10m") -> str:
+    return _read_env("ARCHMIND_OLLAMA_KEEPALIVE", default)
+
+
 def get_openai_api_key(default: str = "") -> str:
     return _read_env("OPENAI_API_KEY", default)
 
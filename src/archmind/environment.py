@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+from collections import deque
 from pathlib import Path
 from typing import Any, Optional
 
@@ -74,7 +75,11 @@ def _collect_log_text(project_dir: Path) -> str:
     if run_logs.exists():
         summaries = sorted(run_logs.glob("run_*.summary.txt"), key=lambda p: p.stat().st_mtime, reverse=True)
         if summaries:
-            chunks.extend(summaries[0].read_text(encoding="utf-8", errors="replace").splitlines()[-80:])
+            tail: deque[str] = deque(maxlen=80)
+            with summaries[0].open("r", encoding="utf-8", errors="replace") as handle:
+                for line in handle:
+                    tail.extend(line.splitlines())
+            chunks.extend(tail)
     return "\n".join(chunks)
 
 
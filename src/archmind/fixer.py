@@ -3,7 +3,9 @@ from __future__ import annotations
 import difflib
 import json
 import re
+import shlex
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -20,7 +22,6 @@ from archmind.failure import (
     select_repair_targets,
     strategy_instructions,
 )
-from archmind.patcher import apply_unified_diff
 from archmind.evaluator import read_evaluation_status
 from archmind.planner import read_plan_summary
 from archmind.runner import RunConfig, RunResult, compute_run_status, run_pipeline
@@ -29,6 +30,11 @@ from archmind.tasks import current_task
 
 LOG_PY_TRACE_RE = re.compile(r'File "([^"]+)", line (\d+)')
 LOG_PYTEST_RE = re.compile(r"^(.+?\.py):(\d+):", re.MULTILINE)
+# line starts/ends are the str.splitlines() boundaries, so a search matches the same first line
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_FAILED_TEST_RE = re.compile(f"(?:^|(?<=[{_LINE_BREAKS}]))(?:FAILED|ERROR) ([^{_LINE_BREAKS}]*)")
+_FRONTEND_FILE_RE = re.compile(r"(frontend/[^\s:]+\.(?:tsx?|jsx?))(?::\d+)?")
+_FRONTEND_ERROR_KEYS = ("error", "ERROR", "Failed", "TypeScript", "TS", "eslint")
 
 KEYWORDS = [
     "Traceback",
@@ -80,7 +86,7 @@ def run_and_collect(
         cmd_parts += ["--profile", profile]
         for cmd in cmds or []:
             cmd_parts += ["--cmd", cmd]
-    config.command = " ".join(cmd_parts)
+    config.command = shlex.join(cmd_parts)
     return run_pipeline(config)
 
 
@@ -92,11 +98,17 @@ def find_latest_run_log(project_dir: Path) -> Optional[Path]:
     return logs[0] if logs else None
 
 
-def read_tail(file_path: Path, n: int = 120) -> list[str]:
-    if not file_path.exists():
+def read_tail(file_path: Optional[Path], n: int = 120) -> list[str]:
+    if file_path is None or not file_path.exists():
         return []
-    lines = file_path.read_text(encoding="utf-8", errors="replace").splitlines()
-    return lines[-n:]
+    if n <= 0:
+        return []
+    # Bounded tail: only the last n lines are ever held, regardless of log size.
+    tail: deque[str] = deque(maxlen=n)
+    with file_path.open("r", encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            tail.extend(line.splitlines())
+    return list(tail)
 
 
 def extract_files_hint(log_tail: list[str]) -> list[str]:
@@ -133,42 +145,43 @@ def _read_failure_summary_section(summary_path: Optional[Path]) -> list[str]:
             except Exception:
                 return []
         return []
-    start = next((i for i, line in enumerate(lines) if line.startswith("4) Failure summary:")), -1)
-    if start == -1:
-        return [line for line in lines[-10:] if line.strip()]
-    end = next((i for i in range(start + 1, len(lines)) if lines[i].startswith("5) ")), len(lines))
-    section = [line.strip() for line in lines[start + 1 : end] if line.strip()]
+    # one pass over the lines: find the section header and collect until the next "5) " heading
+    section: list[str] = []
+    in_section = False
+    for line in lines:
+        if in_section:
+            if line.startswith("5) "):
+                break
+            if line.strip():
+                section.append(line.strip())
+        elif line.startswith("4) Failure summary:"):
+            in_section = True
     return section or [line for line in lines[-10:] if line.strip()]
 
 
 def _extract_failure_details(text: str, failure_class: str = "") -> dict[str, Optional[str | list[str]]]:
-    lines = text.splitlines()
     test_name: Optional[str] = None
     file_path: Optional[str] = None
     is_frontend = (failure_class or "").lower().startswith("frontend")
 
-    for line in lines:
-        if not is_frontend and (line.startswith("FAILED ") or line.startswith("ERROR ")):
-            candidate = line.split(" ", 1)[1]
-            test_id = candidate.split(" - ", 1)[0].strip()
+    # first match only: a single regex search instead of splitting the whole log into lines
+    if is_frontend:
+        match_front = _FRONTEND_FILE_RE.search(text)
+        if match_front:
+            file_path = match_front.group(1)
+    else:
+        match_failed = _FAILED_TEST_RE.search(text)
+        if match_failed:
+            test_id = match_failed.group(1).split(" - ", 1)[0].strip()
             test_name = test_id
-            if "::" in test_id:
-                file_path = test_id.split("::", 1)[0]
-            else:
-                file_path = test_id
-            break
-        if is_frontend:
-            match_front = re.search(r"(frontend/[^\s:]+\.(?:tsx?|jsx?))(?::\d+)?", line)
-            if match_front:
-                file_path = match_front.group(1)
-                break
+            file_path = test_id.split("::", 1)[0]
 
     if file_path is None:
         match = re.search(r'File "([^"]+)"', text)
         if match:
             file_path = match.group(1)
         else:
-            match = re.search(r"^(.+?\.py):\d+:", text, flags=re.MULTILINE)
+            match = LOG_PYTEST_RE.search(text)
             if match:
                 file_path = match.group(1)
 
@@ -184,19 +197,21 @@ def _extract_failure_details(text: str, failure_class: str = "") -> dict[str, Op
 
 
 def _extract_frontend_error_lines(run_result: RunResult, max_lines: int = 200) -> list[str]:
-    lines: list[str] = []
+    # only the last max_lines matches are ever returned, so keep just those
+    lines: deque[str] = deque(maxlen=max_lines)
     for step in run_result.frontend.steps:
         if step.exit_code != 0:
-            combined = (step.stdout + "\n" + step.stderr).splitlines()
-            for line in combined:
-                if any(key in line for key in ("error", "ERROR", "Failed", "TypeScript", "TS", "eslint")):
-                    lines.append(line)
-    if not lines:
-        for step in run_result.frontend.steps:
-            if step.exit_code != 0:
-                lines = (step.stdout + "\n" + step.stderr).splitlines()
-                break
-    return lines[-max_lines:]
+            lines.extend(
+                line
+                for line in (step.stdout + "\n" + step.stderr).splitlines()
+                if any(key in line for key in _FRONTEND_ERROR_KEYS)
+            )
+    if lines:
+        return list(lines)
+    for step in run_result.frontend.steps:
+        if step.exit_code != 0:
+            return (step.stdout + "\n" + step.stderr).splitlines()[-max_lines:]
+    return []
 
 
 def _extract_file_candidates_from_text(text: str) -> list[str]:
@@ -586,8 +601,8 @@ def _write_fix_summary(
         },
         "run": {
             "exit_code": run_result.overall_exit_code,
-            "log_path": str(run_result.log_path),
-            "summary_path": str(run_result.summary_path),
+            "log_path": str(run_result.log_path) if run_result.log_path else None,
+            "summary_path": str(run_result.summary_path) if run_result.summary_path else None,
         },
     }
     json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
@@ -862,6 +877,8 @@ def apply_plan(plan: dict[str, Any], project_dir: Path, apply_changes: bool) ->
 
         diffs.append(diff)
         if apply_changes:
+            from archmind.patcher import apply_unified_diff
+
             apply_unified_diff(project_dir, diff)
 
     return bool(diffs), diffs
@@ -912,18 +929,22 @@ def fix_loop(
         current_signature = failure_signature_from_run_result(run_result)
         if not signature_before:
             signature_before = current_signature
+        # read the run's summary section and log tail once; every excerpt below reuses them
+        failure_section = _read_failure_summary_section(run_result.summary_path)
+        log_tail = read_tail(run_result.log_path, n=120)
+        frontend_error_lines = _extract_frontend_error_lines(run_result, max_lines=200)
         rough_excerpt = extract_failure_excerpt(
-            _read_failure_summary_section(run_result.summary_path),
-            read_tail(run_result.log_path, n=120),
-            _extract_frontend_error_lines(run_result, max_lines=200),
+            failure_section,
+            log_tail,
+            frontend_error_lines,
             max_lines=20,
         )
         classified = classify_failure(rough_excerpt, current_signature)
         failure_class = select_primary_failure_class(current_signature, classified)
         failure_excerpt = extract_failure_excerpt(
-            _read_failure_summary_section(run_result.summary_path),
-            read_tail(run_result.log_path, n=120),
-            _extract_frontend_error_lines(run_result, max_lines=200),
+            failure_section,
+            log_tail,
+            frontend_error_lines,
             max_lines=6,
             failure_class=failure_class,
         )
@@ -975,7 +996,6 @@ def fix_loop(
             print(f"[OK] fixed in {iteration - 1} iterations")
             return 0
 
-        log_tail = read_tail(run_result.log_path, n=120)
         summary_lines = _read_summary_lines(run_result.summary_path)
         key_errors = _collect_key_errors(summary_lines + log_tail)
         files_hint = extract_files_hint(log_tail)
@@ -16,6 +16,7 @@ from .templates.nextjs import enforce_nextjs_runtime
 from .templates.internal_tool import enforce_internal_tool
 from .templates.worker_api import enforce_worker_api
 from .templates.data_tool import enforce_data_tool
+from .json_codec import dumps_indented
 from .backend_runtime import detect_backend_asgi_entry, has_fastapi_app_declaration
 from .reasoning import generate_reasoning_text
 
@@ -233,11 +234,14 @@ def validate_and_fix_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
     return spec
 
 
+def _generation_correction(last_error: Optional[str]) -> str:
+    if not last_error:
+        return ""
+    return f"\n\nPrevious attempt failed due to: {last_error}\nFix the spec accordingly.\n"
+
+
 def build_generation_request(prompt: str, idea: str, last_error: Optional[str] = None) -> str:
-    correction = ""
-    if last_error:
-        correction = f"\n\nPrevious attempt failed due to: {last_error}\nFix the spec accordingly.\n"
-    return f"{prompt}\n\nIDEA:\n{idea}\n{correction}"
+    return f"{prompt}\n\nIDEA:\n{idea}\n{_generation_correction(last_error)}"
 
 
 def generate_valid_spec(prompt: str, idea: str, opt: GenerateOptions) -> Dict[str, Any]:
@@ -251,8 +255,10 @@ def generate_valid_spec(prompt: str, idea: str, opt: GenerateOptions) -> Dict[st
     last_err: Optional[str] = None
     fallback_name = (opt.name or "archmind_project").strip() or "archmind_project"
 
+    # Only the correction suffix changes between attempts; build the (possibly large) base once.
+    base_req = build_generation_request(prompt, idea)
     for attempt in range(1, opt.max_retries + 1):
-        req = build_generation_request(prompt, idea, last_err)
+        req = base_req + _generation_correction(last_err)
         raw = call_ollama_chat(req, model=opt.model, base_url=opt.ollama_base_url, timeout_s=opt.timeout_s)
 
         try:
@@ -391,20 +397,24 @@ def safe_write_file(path: Path, content: str, force: bool) -> None:
     path.write_text(content, encoding="utf-8")
 
 
-def ensure_dirs(base: Path, dirs: List[str]) -> None:
-    base_resolved = base.resolve()
+def ensure_dirs(base_resolved: Path, dirs: List[str]) -> None:
+    """
+    Create spec directories under an already-resolved project root.
+    """
     for d_raw in dirs:
         d = _normalize_relative_path(d_raw)
         if not d:
             continue
-        p = (base / d).resolve()
+        p = (base_resolved / d).resolve()
         if base_resolved not in p.parents and p != base_resolved:
             raise ValueError(f"Invalid directory path escapes base: {d}")
         p.mkdir(parents=True, exist_ok=True)
 
 
-def ensure_files(base: Path, files: Dict[str, str], *, force: bool) -> None:
-    base_resolved = base.resolve()
+def ensure_files(base_resolved: Path, files: Dict[str, str], *, force: bool) -> None:
+    """
+    Write spec files under an already-resolved project root.
+    """
     normalized_files: Dict[str, str] = {}
     for rel_raw, content in files.items():
         rel = _normalize_relative_path(rel_raw)
@@ -412,7 +422,7 @@ def ensure_files(base: Path, files: Dict[str, str], *, force: bool) -> None:
             normalized_files[rel] = content
 
     for rel, content in normalized_files.items():
-        p = (base / rel).resolve()
+        p = (base_resolved / rel).resolve()
         if base_resolved not in p.parents and p != base_resolved:
             raise ValueError(f"Invalid file path escapes base: {rel}")
         safe_write_file(Path(p), content, force=force)
@@ -473,16 +483,16 @@ def write_project(spec: Dict[str, Any], opt: GenerateOptions) -> Path:
             )
 
     project_root.mkdir(parents=True, exist_ok=True)
-    ensure_dirs(project_root, spec.get("directories") or [])
-    ensure_files(project_root, spec.get("files") or {}, force=opt.force)
+    base_resolved = project_root.resolve()
+    ensure_dirs(base_resolved, spec.get("directories") or [])
+    ensure_files(base_resolved, spec.get("files") or {}, force=opt.force)
     ensure_runtime_gitignore(project_root)
 
     # Save spec snapshot (always overwrite inside a newly created folder)
-    safe_write_file(
-        project_root / "archmind_spec.json",
-        json.dumps(spec, ensure_ascii=False, indent=2),
-        force=True,
-    )
+    snapshot_path = base_resolved / "archmind_spec.json"
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    tmp_path.write_bytes(dumps_indented(spec))
+    os.replace(tmp_path, snapshot_path)
     return project_root
 
 
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional C encoder; the stdlib path below produces equivalent JSON
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_indented(payload: Any) -> bytes:
+    """Encode payload as 2-space indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_compact(payload: Any) -> bytes:
+    """Encode payload as whitespace-free UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from raw bytes (or text) without a separate UTF-8 decode step."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -35,11 +35,11 @@ def _normalize_diff_path(raw: str) -> Optional[Path]:
     return Path(path)
 
 
-def _ensure_safe_path(project_dir: Path, rel_path: Path) -> Path:
+def _ensure_safe_path(project_root: Path, rel_path: Path) -> Path:
+    """project_root must already be resolved by the caller."""
     if rel_path.is_absolute() or ".." in rel_path.parts:
         raise ValueError(f"Unsafe patch path: {rel_path}")
-    resolved = (project_dir / rel_path).resolve()
-    project_root = project_dir.resolve()
+    resolved = (project_root / rel_path).resolve()
     if resolved != project_root and project_root not in resolved.parents:
         raise ValueError(f"Patch path escapes project: {rel_path}")
     return resolved
@@ -56,33 +56,62 @@ def _parse_hunk_header(line: str) -> Hunk:
     return Hunk(old_start=old_start, old_count=old_count, new_start=new_start, new_count=new_count, lines=[])
 
 
+def _split_hunk_lines(hunk: Hunk) -> tuple[list[str], list[str]]:
+    old_lines: list[str] = []
+    new_lines: list[str] = []
+    add_old = old_lines.append
+    add_new = new_lines.append
+    for line in hunk.lines:
+        if not line:
+            continue
+        # Single-character markers are cached str objects, so these compares
+        # resolve on identity without a full unicode comparison.
+        marker = line[0]
+        if marker == " ":
+            content = line[1:]
+            add_old(content)
+            add_new(content)
+        elif marker == "-":
+            add_old(line[1:])
+        elif marker == "+":
+            add_new(line[1:])
+        else:
+            raise ValueError(f"Unknown patch marker: {marker}")
+    return old_lines, new_lines
+
+
+def _hunk_mismatch_error(original_lines: list[str], idx: int, hunk: Hunk) -> ValueError:
+    for line in hunk.lines:
+        if not line or line[0] == "+":
+            continue
+        if idx >= len(original_lines) or original_lines[idx] != line[1:]:
+            kind = "context" if line[0] == " " else "deletion"
+            return ValueError(f"Patch {kind} mismatch.")
+        idx += 1
+    return ValueError("Patch context mismatch.")
+
+
 def _apply_hunks(original_lines: list[str], hunks: list[Hunk]) -> list[str]:
+    # Untouched ranges are copied with one slice per gap and each hunk's
+    # expected old lines are verified with a single slice comparison; the
+    # per-line walk only runs to report a mismatch.
     output: list[str] = []
-    idx = 1
+    idx = 0
     for hunk in hunks:
-        while idx < hunk.old_start:
-            output.append(original_lines[idx - 1])
-            idx += 1
-        for line in hunk.lines:
-            if not line:
-                continue
-            marker = line[0]
-            content = line[1:]
-            if marker == " ":
-                if idx > len(original_lines) or original_lines[idx - 1] != content:
-                    raise ValueError("Patch context mismatch.")
-                output.append(content)
-                idx += 1
-            elif marker == "-":
-                if idx > len(original_lines) or original_lines[idx - 1] != content:
-                    raise ValueError("Patch deletion mismatch.")
-                idx += 1
-            elif marker == "+":
-                output.append(content)
-            else:
-                raise ValueError(f"Unknown patch marker: {marker}")
-
-    output.extend(original_lines[idx - 1 :])
+        start = max(hunk.old_start - 1, idx)
+        if start > len(original_lines):
+            raise ValueError("Patch hunk starts past end of file.")
+        output.extend(original_lines[idx:start])
+        idx = start
+
+        old_lines, new_lines = _split_hunk_lines(hunk)
+        end = idx + len(old_lines)
+        if original_lines[idx:end] != old_lines:
+            raise _hunk_mismatch_error(original_lines, idx, hunk)
+        output.extend(new_lines)
+        idx = end
+
+    output.extend(original_lines[idx:])
     return output
 
 
@@ -91,6 +120,7 @@ def apply_unified_diff(project_dir: Path, diff_text: str) -> list[Path]:
         raise ValueError("Empty diff.")
 
     lines = diff_text.splitlines(keepends=True)
+    project_root = project_dir.resolve()
     i = 0
     patches: list[FilePatch] = []
 
@@ -109,7 +139,7 @@ def apply_unified_diff(project_dir: Path, diff_text: str) -> list[Path]:
         rel_path = _normalize_diff_path(new_path_raw) or _normalize_diff_path(old_path_raw)
         if rel_path is None:
             raise ValueError("Deletion patches are not supported.")
-        target_path = _ensure_safe_path(project_dir, rel_path)
+        target_path = _ensure_safe_path(project_root, rel_path)
 
         hunks: list[Hunk] = []
         while i < len(lines) and lines[i].startswith("@@ "):
@@ -130,7 +160,7 @@ def apply_unified_diff(project_dir: Path, diff_text: str) -> list[Path]:
 
     for patch in patches:
         if patch.path.exists():
-            rel = patch.path.resolve().relative_to(project_dir.resolve())
+            rel = patch.path.relative_to(project_root)
             backup_path = backup_root / rel
             backup_path.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(patch.path, backup_path)
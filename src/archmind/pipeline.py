@@ -3,17 +3,21 @@ from __future__ import annotations
 import inspect
 import json
 import os
+import shlex
+import shutil
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import lru_cache
+from itertools import product
 from pathlib import Path
 from typing import Any, Optional
 
-from archmind.fixer import run_fix_loop
 from archmind.backend_runtime import detect_backend_runtime_entry as detect_backend_runtime_entry_shared
 from archmind.brain import reason_architecture_from_idea
 from archmind.failure_memory import append_failure_memory, get_failure_hints
 from archmind.idea_normalizer import normalize_idea
+from archmind.json_codec import dumps_indented
 from archmind.environment import ensure_environment_readiness
 from archmind.evaluator import write_evaluation
 from archmind.github_repo import create_github_repo_with_status
@@ -26,7 +30,7 @@ from archmind.template_selector import (
     resolve_effective_template,
     select_template_for_project_type,
 )
-from archmind.runner import RunConfig, RunResult, compute_run_status, run_pipeline
+from archmind.runner import RunConfig, RunResult, _write_file_bytes, compute_run_status, run_pipeline
 from archmind.state import (
     ensure_state,
     load_state,
@@ -40,7 +44,7 @@ from archmind.state import (
 from archmind.tasks import current_task, ensure_tasks
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineOptions:
     idea: Optional[str]
     path: Optional[Path]
@@ -59,7 +63,7 @@ class PipelineOptions:
     frontend_only: bool
     no_install: bool
     profile: Optional[str]
-    cmds: list[str]
+    cmds: tuple[str, ...]
     timeout_s: int
     scope: str
     max_iterations: int
@@ -70,6 +74,10 @@ class PipelineOptions:
     auto_deploy: bool
     auto_deploy_target: str
 
+    def __post_init__(self) -> None:
+        # Keep the options hashable so derived values can be cached per instance.
+        object.__setattr__(self, "cmds", tuple(self.cmds or ()))
+
 
 SUPPORTED_STARTER_PROFILES = {"todo", "diary", "kanban", "bookmark"}
 
@@ -237,9 +245,16 @@ def _preserve_repository_existence(repository_payload: dict[str, Any], persisted
     return current
 
 
-def _filter_kwargs_for_callable(fn, kwargs: dict[str, Any]) -> dict[str, Any]:
+@lru_cache(maxsize=None)
+def _cached_param_names(fn) -> tuple[frozenset[str], bool]:
+    """Return (parameter names, accepts **kwargs) for fn, computing the signature once."""
     sig = inspect.signature(fn)
-    accepted = set(sig.parameters.keys())
+    has_var_kw = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
+    return frozenset(sig.parameters), has_var_kw
+
+
+def _filter_kwargs_for_callable(fn, kwargs: dict[str, Any]) -> dict[str, Any]:
+    accepted, _ = _cached_param_names(fn)
     return {k: v for k, v in kwargs.items() if k in accepted}
 
 
@@ -266,6 +281,39 @@ def _resolve_generator_entry():
     )
 
 
+@lru_cache(maxsize=None)
+def _generator_call_strategy(fn) -> str:
+    """
+    Pick how to call a generator entrypoint from its signature, once per callable:
+    "idea_opt" -> fn(idea, opt), "idea" -> fn(idea), "none" -> fn(), "kwargs" -> fn(**filtered).
+    """
+    params = inspect.signature(fn).parameters.values()
+    positional = [
+        p for p in params if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    var_positional = any(p.kind == inspect.Parameter.VAR_POSITIONAL for p in params)
+    required_positional = sum(1 for p in positional if p.default is inspect.Parameter.empty)
+    required_kw_only = any(
+        p.kind == inspect.Parameter.KEYWORD_ONLY and p.default is inspect.Parameter.empty for p in params
+    )
+    if not required_kw_only:
+        for strategy, arg_count in (("idea_opt", 2), ("idea", 1), ("none", 0)):
+            if required_positional <= arg_count and (var_positional or len(positional) >= arg_count):
+                return strategy
+    return "kwargs"
+
+
+def _call_generator_entry(fn, idea: str, opt: Any) -> Any:
+    strategy = _generator_call_strategy(fn)
+    if strategy == "idea_opt":
+        return fn(idea, opt)
+    if strategy == "idea":
+        return fn(idea)
+    if strategy == "none":
+        return fn()
+    return fn(**_filter_kwargs_for_callable(fn, {"idea": idea, "opt": opt, "options": opt}))
+
+
 def _make_generate_options(opt_kwargs: dict[str, Any]):
     from archmind.generator import GenerateOptions  # type: ignore
 
@@ -288,23 +336,7 @@ def _resolve_project_dir(
         if isinstance(project_spec_seed, dict) and project_spec_seed:
             setattr(opt, "project_spec", normalize_project_spec_seed(project_spec_seed))
         gen_entry = _resolve_generator_entry()
-
-        # positional-first call attempt
-        try_orders = [
-            (opts.idea, opt),
-            (opts.idea,),
-            (),
-        ]
-        for tup in try_orders:
-            try:
-                generated = gen_entry(*tup)
-                return Path(generated).resolve() if generated else None
-            except TypeError:
-                pass
-
-        call_kwargs = {"idea": opts.idea, "opt": opt, "options": opt}
-        filtered = _filter_kwargs_for_callable(gen_entry, call_kwargs)
-        generated = gen_entry(**filtered)
+        generated = _call_generator_entry(gen_entry, opts.idea, opt)
         return Path(generated).resolve() if generated else None
 
     if opts.path:
@@ -318,14 +350,14 @@ def _generate_options_supported_fields(cls: type) -> Optional[set[str]]:
         return set(getattr(cls, "__dataclass_fields__", {}).keys())
 
     try:
-        sig = inspect.signature(cls.__init__)
+        names, has_var_kw = _cached_param_names(cls.__init__)
     except (TypeError, ValueError):
-        sig = inspect.signature(cls)
+        names, has_var_kw = _cached_param_names(cls)
 
-    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()):
+    if has_var_kw:
         return None
 
-    return {k for k in sig.parameters.keys() if k != "self"}
+    return set(names - {"self"})
 
 
 def _add_first_supported(
@@ -365,84 +397,115 @@ def _build_generate_options_kwargs(opts: PipelineOptions) -> dict[str, Any]:
     return result
 
 
-def _latest_run_summary(project_dir: Path) -> Optional[str]:
-    log_dir = project_dir / ".archmind" / "run_logs"
-    if not log_dir.exists():
-        return None
-    summaries = sorted(log_dir.glob("run_*.summary.txt"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if not summaries:
-        return None
-    return summaries[0].read_text(encoding="utf-8", errors="replace")
+@dataclass
+class _RunLogScan:
+    summary: Optional[Path] = None
+    run_prompt: Optional[Path] = None
+    fix_prompt: Optional[Path] = None
 
 
-def _latest_path(project_dir: Path, pattern: str) -> Optional[Path]:
-    base = project_dir / ".archmind" / "run_logs"
-    if not base.exists():
-        return None
-    matches = sorted(base.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
-    return matches[0] if matches else None
+def _scan_run_logs(log_dir: Path) -> _RunLogScan:
+    """Find the newest run summary, run prompt and fix prompt in one pass over run_logs."""
+    newest: dict[str, tuple[float, str]] = {}
+    try:
+        entries = os.scandir(log_dir)
+    except OSError:
+        return _RunLogScan()
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("run_") and name.endswith(".summary.txt"):
+                key = "summary"
+            elif name.endswith(".prompt.md"):
+                key = "fix_prompt" if name.startswith("fix_") else "run_prompt"
+            else:
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            current = newest.get(key)
+            if current is None or mtime > current[0]:
+                newest[key] = (mtime, name)
+    return _RunLogScan(**{key: log_dir / name for key, (_, name) in newest.items()})
 
 
-def _latest_run_prompt(project_dir: Path) -> Optional[Path]:
-    base = project_dir / ".archmind" / "run_logs"
-    if not base.exists():
-        return None
-    matches = sorted(base.glob("*.prompt.md"), key=lambda p: p.stat().st_mtime, reverse=True)
-    for path in matches:
-        if not path.name.startswith("fix_"):
-            return path
-    return None
+def _stream_latest_summary(log_dir: Path) -> bool:
+    """Copy the newest run summary to stdout as raw bytes instead of loading it as a str."""
+    summary = _scan_run_logs(log_dir).summary
+    if summary is None:
+        return False
+    try:
+        src = open(summary, "rb")
+    except OSError:
+        return False
+    with src:
+        if os.fstat(src.fileno()).st_size == 0:
+            return False
+        print("[FAIL] 마지막 run 요약:")
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            print(src.read().decode("utf-8", errors="replace"))
+            return True
+        sys.stdout.flush()
+        shutil.copyfileobj(src, out, 65536)
+        out.write(b"\n")
+        out.flush()
+    return True
+
+
+# (attribute, flag, kind) in CLI order. Kinds:
+#   "value"  -> "--flag value" when the value is truthy
+#   "always" -> "--flag value" unconditionally
+#   "flag"   -> bare "--flag" when truthy
+#   "repeat" -> "--flag item" per item, only alongside --profile
+_COMMAND_SPEC: tuple[tuple[str, str, str], ...] = (
+    ("path", "--path", "value"),
+    ("idea", "--idea", "value"),
+    ("out", "--out", "value"),
+    ("name", "--name", "value"),
+    ("template", "--template", "value"),
+    ("starter_profile", "--starter-profile", "value"),
+    ("prompt", "--prompt", "value"),
+    ("gen_model", "--gen-model", "value"),
+    ("gen_ollama_base_url", "--gen-ollama-base-url", "value"),
+    ("gen_max_retries", "--gen-max-retries", "always"),
+    ("gen_timeout_s", "--gen-timeout-s", "always"),
+    ("run_all", "--all", "flag"),
+    ("backend_only", "--backend-only", "flag"),
+    ("frontend_only", "--frontend-only", "flag"),
+    ("profile", "--profile", "value"),
+    ("cmds", "--cmd", "repeat"),
+    ("no_install", "--no-install", "flag"),
+    ("timeout_s", "--timeout-s", "always"),
+    ("scope", "--scope", "always"),
+    ("max_iterations", "--max-iterations", "always"),
+    ("model", "--model", "always"),
+    ("apply", "--apply", "flag"),
+    ("dry_run", "--dry-run", "flag"),
+    ("json_summary", "--json-summary", "flag"),
+    ("auto_deploy", "--auto-deploy", "flag"),
+    ("auto_deploy_target", "--deploy-target", "value"),
+)
 
 
 def _build_command(opts: PipelineOptions) -> str:
-    parts = ["archmind", "pipeline"]
-    if opts.path:
-        parts += ["--path", str(opts.path)]
-    if opts.idea:
-        parts += ["--idea", opts.idea]
-    if opts.out:
-        parts += ["--out", opts.out]
-    if opts.name:
-        parts += ["--name", opts.name]
-    if opts.template:
-        parts += ["--template", opts.template]
-    if opts.starter_profile:
-        parts += ["--starter-profile", opts.starter_profile]
-    if opts.prompt:
-        parts += ["--prompt", opts.prompt]
-    if opts.gen_model:
-        parts += ["--gen-model", opts.gen_model]
-    if opts.gen_ollama_base_url:
-        parts += ["--gen-ollama-base-url", opts.gen_ollama_base_url]
-    parts += ["--gen-max-retries", str(opts.gen_max_retries)]
-    parts += ["--gen-timeout-s", str(opts.gen_timeout_s)]
-    if opts.run_all:
-        parts.append("--all")
-    if opts.backend_only:
-        parts.append("--backend-only")
-    if opts.frontend_only:
-        parts.append("--frontend-only")
-    if opts.profile:
-        parts += ["--profile", opts.profile]
-        for cmd in opts.cmds:
-            parts += ["--cmd", cmd]
-    if opts.no_install:
-        parts.append("--no-install")
-    parts += ["--timeout-s", str(opts.timeout_s)]
-    parts += ["--scope", opts.scope]
-    parts += ["--max-iterations", str(opts.max_iterations)]
-    parts += ["--model", opts.model]
-    if opts.apply:
-        parts.append("--apply")
-    if opts.dry_run:
-        parts.append("--dry-run")
-    if opts.json_summary:
-        parts.append("--json-summary")
-    if opts.auto_deploy:
-        parts.append("--auto-deploy")
-    if opts.auto_deploy_target:
-        parts += ["--deploy-target", opts.auto_deploy_target]
-    return " ".join(parts)
+    tokens = ["archmind", "pipeline"]
+    append = tokens.append
+    for name, flag, kind in _COMMAND_SPEC:
+        value = getattr(opts, name)
+        if kind == "flag":
+            if value:
+                append(flag)
+        elif kind == "repeat":
+            if opts.profile:
+                for item in value:
+                    append(flag)
+                    append(str(item))
+        elif value or kind == "always":
+            append(flag)
+            append(str(value))
+    return shlex.join(tokens)
 
 
 def _normalize_starter_profile(value: str | None) -> str:
@@ -631,23 +694,44 @@ def _validate_todo_materialization(project_dir: Path, spec_seed: dict[str, Any]
     return _validate_starter_materialization(project_dir, "todo", spec_seed)
 
 
-def compute_status(
+def _status_from_flags(
     run_before_ok: bool,
-    fix_exit: Optional[int],
-    run_after_ok: Optional[bool],
+    fix_missing: bool,
+    fix_failed: bool,
+    run_after_ok: bool,
     apply: bool,
 ) -> str:
     if run_before_ok:
         return "SUCCESS"
-    if fix_exit is None:
+    if fix_missing:
         return "FAIL"
-    if fix_exit != 0:
+    if fix_failed:
         return "PARTIAL" if not apply else "FAIL"
     if run_after_ok:
         return "SUCCESS"
     return "FAIL"
 
 
+# Every combination of the five predicates, indexed by the bit packing in compute_status.
+_STATUS_TABLE: tuple[str, ...] = tuple(_status_from_flags(*flags) for flags in product((False, True), repeat=5))
+
+
+def compute_status(
+    run_before_ok: bool,
+    fix_exit: Optional[int],
+    run_after_ok: Optional[bool],
+    apply: bool,
+) -> str:
+    index = (
+        (bool(run_before_ok) << 4)
+        | ((fix_exit is None) << 3)
+        | ((fix_exit is not None and fix_exit != 0) << 2)
+        | (bool(run_after_ok) << 1)
+        | bool(apply)
+    )
+    return _STATUS_TABLE[index]
+
+
 def _pipeline_final_status(project_dir: Path, status: str, state_payload: dict[str, Any]) -> str:
     normalized = str(status or "").strip().upper()
     runtime_block = state_payload.get("runtime") if isinstance(state_payload.get("runtime"), dict) else {}
@@ -711,17 +795,22 @@ def _build_result_text(payload: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def write_result(project_dir: Path, payload: dict[str, Any]) -> tuple[Path, Path]:
-    result_dir = project_dir / ".archmind"
+def write_result(
+    project_dir: Path,
+    payload: dict[str, Any],
+    *,
+    result_dir: Optional[Path] = None,
+) -> tuple[Path, Path]:
+    result_dir = result_dir or project_dir.joinpath(".archmind")
     result_dir.mkdir(parents=True, exist_ok=True)
     json_path = result_dir / "result.json"
     txt_path = result_dir / "result.txt"
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    txt_path.write_text(_build_result_text(payload), encoding="utf-8")
+    json_path.write_bytes(dumps_indented(payload))
+    txt_path.write_bytes(_build_result_text(payload).encode("utf-8"))
     return json_path, txt_path
 
 
-def _build_run_config(opts: PipelineOptions, project_dir: Path) -> RunConfig:
+def _build_run_config(opts: PipelineOptions, project_dir: Path, log_dir: Optional[Path] = None) -> RunConfig:
     if opts.backend_only:
         run_all = False
         backend_only = True
@@ -747,11 +836,11 @@ def _build_run_config(opts: PipelineOptions, project_dir: Path) -> RunConfig:
         frontend_only=frontend_only,
         no_install=opts.no_install,
         timeout_s=opts.timeout_s,
-        log_dir=project_dir / ".archmind" / "run_logs",
+        log_dir=log_dir or project_dir.joinpath(".archmind", "run_logs"),
         json_summary=True,
         command="archmind pipeline run",
         profile=opts.profile,
-        cmds=opts.cmds,
+        cmds=list(opts.cmds),
     )
 
 
@@ -767,6 +856,7 @@ def _effective_fix_scope(opts: PipelineOptions) -> str:
 
 def _write_pipeline_logs(
     project_dir: Path,
+    log_dir: Path,
     timestamp: str,
     project_type: str,
     selected_template: str,
@@ -778,12 +868,12 @@ def _write_pipeline_logs(
     final_exit: int,
     json_summary: bool,
 ) -> None:
-    log_dir = project_dir / ".archmind" / "pipeline_logs"
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    log_path = log_dir / f"pipeline_{timestamp}.log"
-    summary_path = log_dir / f"pipeline_{timestamp}.summary.txt"
-    summary_json_path = log_dir / f"pipeline_{timestamp}.summary.json"
+    prefix = f"pipeline_{timestamp}"
+    log_path = log_dir / f"{prefix}.log"
+    summary_path = log_dir / f"{prefix}.summary.txt"
+    summary_json_path = log_dir / f"{prefix}.summary.json"
 
     log_lines = [
         f"timestamp: {timestamp}",
@@ -797,7 +887,7 @@ def _write_pipeline_logs(
         f"rerun_exit: {rerun_exit if rerun_exit is not None else 'N/A'}",
         f"final_exit: {final_exit}",
     ]
-    log_path.write_text("\n".join(log_lines) + "\n", encoding="utf-8")
+    _write_file_bytes(log_path, ("\n".join(log_lines) + "\n").encode("utf-8"))
 
     summary_lines = [
         "1) Pipeline meta:",
@@ -816,7 +906,7 @@ def _write_pipeline_logs(
         "5) Final:",
         f"- exit_code: {final_exit}",
     ]
-    summary_path.write_text("\n".join(summary_lines) + "\n", encoding="utf-8")
+    _write_file_bytes(summary_path, ("\n".join(summary_lines) + "\n").encode("utf-8"))
 
     if json_summary:
         payload = {
@@ -831,12 +921,15 @@ def _write_pipeline_logs(
             "rerun": {"exit_code": rerun_exit},
             "final_exit_code": final_exit,
         }
-        summary_json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        _write_file_bytes(summary_json_path, dumps_indented(payload))
 
 
-def _run_component_statuses(run_result: RunResult) -> dict[str, Any]:
+def _run_component_statuses(
+    run_result: RunResult,
+    status_reason: Optional[tuple[str, Optional[str]]] = None,
+) -> dict[str, Any]:
     if run_result.profile and run_result.profile != "legacy" and run_result.profile_steps is not None:
-        status, reason = compute_run_status(run_result)
+        status, reason = status_reason or compute_run_status(run_result)
         return {"profile": run_result.profile, "status": status, "reason": reason}
     return {
         "backend_status": run_result.backend.status,
@@ -1155,7 +1248,7 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
         default_template = resolve_default_template()
         effective_template, fallback_reason = resolve_effective_template(selected_template, default_template)
         template_fallback_reason = fallback_reason or ""
-        opts.template = effective_template
+        opts = replace(opts, template=effective_template)
     else:
         fallback_template = resolve_default_template()
         effective_template = opts.template or fallback_template or "fastapi"
@@ -1419,9 +1512,13 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
             print(f"[WARN] repository state sync failed: {exc}", file=sys.stderr)
     repository_result = _preserve_repository_existence(repository_result, persisted_repository)
 
-    run_config = _build_run_config(opts, project_dir)
-    command = _build_command(opts)
     archmind_dir = project_dir / ".archmind"
+    run_log_dir = archmind_dir.joinpath("run_logs")
+    pipeline_log_dir = archmind_dir.joinpath("pipeline_logs")
+    # Loop invariants: none of these depend on the iteration.
+    run_config = _build_run_config(opts, project_dir, run_log_dir)
+    command = _build_command(opts)
+    fix_scope = _effective_fix_scope(opts)
     existing_result = {}
     existing_state = {}
     try:
@@ -1456,7 +1553,12 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
     rerun_exit: Optional[int] = None
     rerun_result: Optional[RunResult] = None
     run_result: Optional[RunResult] = None
+    run_status = ""
+    run_reason: Optional[str] = None
+    rerun_status: Optional[str] = None
+    rerun_reason: Optional[str] = None
     github_repo_url: Optional[str] = str(repository_result.get("url") or "").strip() or None
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     for iteration in range(1, opts.max_iterations + 1):
         try:
@@ -1470,7 +1572,7 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
         except Exception:
             pass
         run_result = run_pipeline(run_config)
-        run_status, _ = compute_run_status(run_result)
+        run_status, run_reason = compute_run_status(run_result)
         try:
             update_after_run(
                 project_dir,
@@ -1500,16 +1602,19 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
             )
         except Exception as exc:
             print(f"[WARN] state phase(FIXING) failed: {exc}", file=sys.stderr)
+        # the fix loop pulls in the patcher and failure classifier; only load them when a fix runs
+        from archmind.fixer import run_fix_loop
+
         fix_exit = run_fix_loop(
             project_dir=project_dir,
             max_iterations=opts.max_iterations,
             model=opts.model,
             dry_run=opts.dry_run,
             timeout_s=opts.timeout_s,
-            scope=_effective_fix_scope(opts),
+            scope=fix_scope,
             apply_changes=opts.apply,
             profile=opts.profile,
-            cmds=opts.cmds,
+            cmds=list(opts.cmds),
         )
         try:
             update_after_fix(
@@ -1540,7 +1645,7 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
         except Exception as exc:
             print(f"[WARN] state phase(RUNNING) failed: {exc}", file=sys.stderr)
         rerun_result = run_pipeline(run_config)
-        rerun_status, _ = compute_run_status(rerun_result)
+        rerun_status, rerun_reason = compute_run_status(rerun_result)
         try:
             update_after_run(
                 project_dir,
@@ -1559,9 +1664,9 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
         print("[ERROR] Pipeline did not execute any run steps.", file=sys.stderr)
         return 1
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     _write_pipeline_logs(
         project_dir,
+        pipeline_log_dir,
         timestamp,
         project_type,
         selected_template,
@@ -1574,20 +1679,20 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
         opts.json_summary,
     )
 
-    run_status, run_reason = compute_run_status(run_result)
+    # Statuses were already computed inside the loop for the final run/rerun results.
     run_before_ok = run_status in ("SUCCESS", "SKIP")
     run_after_ok = None
     if rerun_result is not None:
-        rerun_status, _ = compute_run_status(rerun_result)
         run_after_ok = rerun_status in ("SUCCESS", "SKIP")
     status = compute_status(run_before_ok, fix_exit, run_after_ok, opts.apply)
 
-    run_prompt = _latest_run_prompt(project_dir)
-    fix_prompt = _latest_path(project_dir, "fix_*.prompt.md")
+    run_logs = _scan_run_logs(run_log_dir)
+    run_prompt = run_logs.run_prompt
+    fix_prompt = run_logs.fix_prompt
     last_run = rerun_result or run_result
     artifacts = {
-        "run_log": str(last_run.log_path) if last_run else None,
-        "run_summary": str(last_run.summary_path) if last_run else None,
+        "run_log": str(last_run.log_path) if last_run and last_run.log_path else None,
+        "run_summary": str(last_run.summary_path) if last_run and last_run.summary_path else None,
         "run_prompt": str(run_prompt) if run_prompt else None,
         "fix_prompt": str(fix_prompt) if fix_prompt else None,
         "json_summary": str(last_run.json_summary_path) if last_run and last_run.json_summary_path else None,
@@ -1631,23 +1736,25 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
                 "ok": run_before_ok,
                 "status": run_status,
                 "reason": run_reason,
-                "log": str(run_result.log_path),
-                "summary": str(run_result.summary_path),
-                "detail": _run_component_statuses(run_result),
+                "log": str(run_result.log_path) if run_result.log_path else None,
+                "summary": str(run_result.summary_path) if run_result.summary_path else None,
+                "detail": _run_component_statuses(run_result, (run_status, run_reason)),
             },
             "fix": {
                 "attempted": fix_exit is not None,
                 "applied": bool(opts.apply),
                 "iterations": opts.max_iterations if fix_exit is not None else 0,
                 "model": opts.model,
-                "scope": _effective_fix_scope(opts),
+                "scope": fix_scope,
                 "prompt": str(fix_prompt) if fix_prompt else None,
             },
             "run_after_fix": {
                 "ok": bool(run_after_ok) if run_after_ok is not None else False,
-                "log": str(rerun_result.log_path) if rerun_result else None,
-                "summary": str(rerun_result.summary_path) if rerun_result else None,
-                "detail": _run_component_statuses(rerun_result) if rerun_result else None,
+                "log": str(rerun_result.log_path) if rerun_result and rerun_result.log_path else None,
+                "summary": str(rerun_result.summary_path) if rerun_result and rerun_result.summary_path else None,
+                "detail": (
+                    _run_component_statuses(rerun_result, (str(rerun_status), rerun_reason)) if rerun_result else None
+                ),
             },
         },
         "artifacts": artifacts,
@@ -1733,11 +1840,11 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
             "iterations": state_payload.get("iterations"),
             "current_task_id": state_payload.get("current_task_id"),
         }
-        artifacts["state"] = str(project_dir / ".archmind" / "state.json")
+        artifacts["state"] = str(archmind_dir / "state.json")
     final_status = _pipeline_final_status(project_dir, status, state_payload or {})
     payload["final_status"] = final_status
 
-    result_json, _ = write_result(project_dir, payload)
+    result_json, _ = write_result(project_dir, payload, result_dir=archmind_dir)
     try:
         synced_state = load_state(project_dir) or {}
         synced_state["project_type"] = project_type
@@ -1782,10 +1889,7 @@ def run_pipeline_command(opts: PipelineOptions) -> int:
         pass
 
     if status != "SUCCESS":
-        summary = _latest_run_summary(project_dir)
-        if summary:
-            print("[FAIL] 마지막 run 요약:")
-            print(summary)
+        _stream_latest_summary(run_log_dir)
 
     if status == "SUCCESS":
         print(f"[DONE] SUCCESS. result: {result_json}")
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+import time
+from typing import Any, Optional
 
 import requests
 
+from archmind.config import get_local_keep_alive
 from archmind.providers.base import ProviderError, ReasoningProvider
 
 
 class LocalProvider(ReasoningProvider):
-    def __init__(self, *, base_url: str, model: str, timeout_s: int = 240) -> None:
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        model: str,
+        timeout_s: int = 240,
+        keep_alive: Optional[str] = None,
+    ) -> None:
         self.base_url = str(base_url or "http://127.0.0.1:11434").rstrip("/")
         self.model = str(model or "llama3:latest").strip() or "llama3:latest"
         self.timeout_s = int(timeout_s)
+        self.keep_alive = str(keep_alive if keep_alive is not None else get_local_keep_alive()).strip()
 
     def generate(self, prompt: str, **kwargs: Any) -> str:
         if not str(prompt or "").strip():
@@ -27,33 +38,48 @@ class LocalProvider(ReasoningProvider):
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": str(prompt)},
             ],
-            "stream": False,
+            "stream": True,
             "options": {"temperature": temperature},
         }
         if format_json:
             payload["format"] = "json"
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
 
         url = f"{self.base_url}/api/chat"
+        # Ollama streams NDJSON chunks; decode each one as it arrives instead of
+        # buffering the whole response body before parsing. The requests timeout only
+        # bounds the gap between chunks, so the total generation time is capped here.
+        deadline = time.monotonic() + timeout_s
+        parts: list[str] = []
         try:
-            response = requests.post(url, json=payload, timeout=timeout_s)
-            response.raise_for_status()
-            body = response.json()
+            with requests.post(url, json=payload, timeout=timeout_s, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line:
+                        parts.append(self._extract_chunk_text(json.loads(line)))
+                    if time.monotonic() > deadline:
+                        raise ProviderError(f"local provider timed out after {timeout_s}s")
+        except ProviderError:
+            raise
         except Exception as exc:
             raise ProviderError(f"local provider request failed: {exc}") from exc
 
-        text = self._extract_text(body)
+        text = "".join(parts).strip()
         if not text:
             raise ProviderError("local provider returned empty text")
         return text
 
     @staticmethod
-    def _extract_text(body: Any) -> str:
+    def _extract_chunk_text(body: Any) -> str:
         if not isinstance(body, dict):
             return ""
+        # mid-stream failures arrive as an {"error": ...} line on an HTTP 200 response
+        if body.get("error"):
+            raise ProviderError(str(body["error"]))
         message = body.get("message")
         if isinstance(message, dict):
-            text = str(message.get("content") or "").strip()
+            text = str(message.get("content") or "")
             if text:
                 return text
-        text = str(body.get("response") or body.get("text") or "").strip()
-        return text
+        return str(body.get("response") or body.get("text") or "")
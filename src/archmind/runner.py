@@ -1,15 +1,60 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import selectors
+import shlex
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Callable, Optional, Sequence, TypeVar
+
+from archmind.json_codec import dumps_compact, dumps_indented, loads
+
+_INSTALL_TAIL_LINES = 200
+_MAX_CHECK_WORKERS = 4
+_TERMINATE_GRACE_S = 2.0
+_CANCEL_POLL_S = 0.1
+_LOG_INLINE_LIMIT = 1 << 20
+_PROMPT_CHECKLIST = "# 완료 조건 체크리스트\n- [ ] python -m pytest -q 통과\n- [ ] 기존 기능 영향 없음\n"
+
+_RE_ZERO_ERRORS = re.compile(r"\b0 errors?\b")
+_RE_NO_ERRORS = re.compile(r"\bno\b[^.\n]*\berrors?\b")
+_RE_TS_CODE = re.compile(r"\bts\d{4}\b")
+_RE_ERRORS = re.compile(r"\berrors?\b")
+_RE_ERROR_COLON = re.compile(r"\berror:\b")
+_RE_ZERO_WARNINGS = re.compile(r"\b0 warnings?\b")
+_RE_NO_WARNINGS = re.compile(r"\bno\b[^.\n]*\bwarnings?\b")
+_RE_WARNINGS = re.compile(r"\bwarnings?\b")
+_RE_WARNING_COLON = re.compile(r"\bwarning:\b")
+_RE_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_KEY_LINE = re.compile(r"FAILED|AssertionError|Traceback|short test summary info")
+
+_RE_FAILURE_SCAN = re.compile(
+    r"^(?:FAILED|ERROR) (?P<test>.*?)(?: - |$)"
+    r'|File "(?P<file>[^"]+)"'
+    r"|^(?P<pyfile>.+?\.py):\d+:"
+    r"|(?P<trace>Traceback)",
+    re.MULTILINE,
+)
+
+_T = TypeVar("_T")
+
+# field order of the per-step records in summary.json / result.json
+_PROFILE_STEP_KEYS = ("name", "status", "cmd", "exit_code", "duration_s")
+_FRONTEND_STEP_KEYS = ("name", "cmd", "exit_code", "duration_s", "summary_lines")
+_profile_step_fields = attrgetter(*_PROFILE_STEP_KEYS)
+_frontend_step_fields = attrgetter(*_FRONTEND_STEP_KEYS)
 
 
 @dataclass
@@ -25,6 +70,17 @@ class RunConfig:
     command: str
     profile: Optional[str] = None
     cmds: Optional[list[str]] = None
+    json_summary_indent: bool = True
+    # generic-shell profile: run independent --cmd entries concurrently (opt-in)
+    parallel_cmds: bool = False
+    # generic-shell profile: stop at the first failing --cmd (sequential and parallel)
+    fail_fast: bool = True
+    # write <timestamp>.prompt.md on failing runs; callers that never read it can skip the work
+    emit_failure_prompt: bool = True
+    # build the RunResult in memory only: no run log, summaries, result files or prompt
+    write_logs: bool = True
+    # resolved interpreter for backend pytest, filled on first use
+    _python_exec: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 
 @dataclass
@@ -36,6 +92,16 @@ class CommandResult:
     stdout: str
     stderr: str
     timed_out: bool = False
+    log_path: Optional[Path] = None
+    cmd_str: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.cmd_str:
+            self.cmd_str = shlex.join(self.cmd)
+
+    @cached_property
+    def combined(self) -> str:
+        return (self.stdout + "\n" + self.stderr).strip()
 
 
 @dataclass
@@ -60,6 +126,15 @@ class FrontendStepResult:
     stderr: str
     summary_lines: list[str]
     timed_out: bool = False
+    cmd_str: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.cmd_str:
+            self.cmd_str = shlex.join(self.cmd)
+
+    @cached_property
+    def combined(self) -> str:
+        return (self.stdout + "\n" + self.stderr).strip()
 
 
 @dataclass
@@ -71,6 +146,8 @@ class FrontendResult:
     steps: list[FrontendStepResult]
     summary_lines: list[str]
     reason: Optional[str] = None
+    # full step output; a scratch file until write_log_and_summary folds it into the run log
+    output_log: Optional[Path] = None
 
 
 @dataclass
@@ -78,8 +155,9 @@ class RunResult:
     backend: BackendResult
     frontend: FrontendResult
     overall_exit_code: int
-    log_path: Path
-    summary_path: Path
+    # None when the run was made with write_logs=False
+    log_path: Optional[Path]
+    summary_path: Optional[Path]
     json_summary_path: Optional[Path]
     timestamp: str
     profile: Optional[str] = None
@@ -97,116 +175,365 @@ class ProfileStepResult:
     stderr: str
     timed_out: bool = False
 
+    @cached_property
+    def combined(self) -> str:
+        return (self.stdout + "\n" + self.stderr).strip()
 
-def _normalize_output(output: str | bytes | None) -> str:
-    if output is None:
-        return ""
-    if isinstance(output, bytes):
-        return output.decode("utf-8", errors="replace")
-    return output
 
+def _skipped_backend(reason: str) -> BackendResult:
+    return BackendResult(
+        status="SKIPPED",
+        cmd=None,
+        cwd=None,
+        exit_code=None,
+        duration_s=None,
+        output="",
+        summary_lines=[],
+        reason=reason,
+    )
 
-def run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
-    start = time.monotonic()
+
+def _skipped_frontend(reason: str) -> FrontendResult:
+    return FrontendResult(
+        status="SKIPPED",
+        node_detected=False,
+        npm_detected=False,
+        install_attempted=False,
+        steps=[],
+        summary_lines=[],
+        reason=reason,
+    )
+
+
+# placeholders for sides that were not run; built once and shared by every RunResult,
+# so they must be treated as read-only (nothing in archmind mutates result objects)
+_SKIPPED_BACKEND_PROFILE = _skipped_backend("profile run")
+_SKIPPED_FRONTEND_PROFILE = _skipped_frontend("profile run")
+_SKIPPED_BACKEND_DEFAULT = _skipped_backend("backend not requested.")
+_SKIPPED_FRONTEND_DEFAULT = _skipped_frontend("frontend not requested.")
+
+
+class _OutputBuffer:
+    def __init__(self, tail_lines: Optional[int] = None) -> None:
+        self._chunks: list[bytes] = []
+        self._tail: Optional[deque[bytes]] = deque(maxlen=tail_lines) if tail_lines else None
+        self._partial = b""
+
+    def feed(self, data: bytes) -> None:
+        if self._tail is None:
+            self._chunks.append(data)
+            return
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        self._tail.extend(lines)
+
+    def text(self) -> str:
+        if self._tail is None:
+            raw = b"".join(self._chunks)
+        else:
+            lines = list(self._tail)
+            if self._partial:
+                lines.append(self._partial)
+            raw = b"\n".join(lines[-self._tail.maxlen :])
+        # normalise line endings on the raw bytes (0x0D never occurs inside a UTF-8 sequence),
+        # so the common CR-free output is decoded once and never rescanned as text
+        if b"\r" in raw:
+            raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        return raw.decode("utf-8", errors="replace")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=timeout_s,
-        )
-        duration = time.monotonic() - start
-        return CommandResult(
-            cmd=cmd,
-            cwd=cwd,
-            exit_code=result.returncode,
-            duration_s=duration,
-            stdout=result.stdout,
-            stderr=result.stderr,
-            timed_out=False,
-        )
-    except subprocess.TimeoutExpired as exc:
-        duration = time.monotonic() - start
-        stdout = _normalize_output(exc.stdout)
-        stderr = _normalize_output(exc.stderr)
-        return CommandResult(
-            cmd=cmd,
-            cwd=cwd,
-            exit_code=124,
-            duration_s=duration,
-            stdout=stdout,
-            stderr=stderr,
-            timed_out=True,
-        )
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
 
+def _replace_file_if_changed(path: Path, data: bytes) -> bool:
+    # result.json/result.txt are watched by editors and the dashboard: leave identical
+    # content untouched, and swap changed content in atomically so readers never see a
+    # half-written file
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(path.name + ".tmp")
+    _write_file_bytes(tmp_path, data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _stream_log_lines(path: Path, lines: Sequence[str]) -> None:
+    # same bytes as write_text("\n".join(lines).strip() + "\n"), but large
+    # captured outputs are written through instead of joined into one string
+    if sum(map(len, lines)) <= _LOG_INLINE_LIMIT:
+        # small logs (the common case): encode once and hand the kernel a single write
+        _write_file_bytes(path, ("\n".join(lines).rstrip() + "\n").encode("utf-8"))
+        return
+    last = len(lines) - 1
+    while last >= 0 and not lines[last].strip():
+        last -= 1
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        if last < 0:
+            handle.write("\n")
+            return
+        for idx in range(last):
+            handle.write(lines[idx])
+            handle.write("\n")
+        # the last section is usually a captured output blob; only copy it when it needs trimming
+        tail = lines[last]
+        handle.write(tail.rstrip() if tail[-1].isspace() else tail)
+        handle.write("\n")
+
+
+def _start_log_write(path: Path, lines: Sequence[str]) -> Callable[[], None]:
+    # large logs are streamed on a worker thread while the caller builds and writes the
+    # summary files; small ones are written inline. Call the returned function before
+    # handing the log path out: it waits for the write and re-raises its error, if any.
+    if sum(map(len, lines)) <= _LOG_INLINE_LIMIT:
+        _stream_log_lines(path, lines)
+        return lambda: None
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="archmind-log")
+    future = executor.submit(_stream_log_lines, path, lines)
+    executor.shutdown(wait=False)
+    return future.result
+
+
+def _pump_process(
+    proc: subprocess.Popen,
+    timeout_s: int,
+    stdout_buf: _OutputBuffer,
+    stderr_buf: _OutputBuffer,
+    log_fd: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> bool:
+    deadline = time.monotonic() + timeout_s
+    timed_out = False
+    stopping = False
+    # with a cancel event, wake up regularly so a cancelled child is stopped promptly
+    tick = _CANCEL_POLL_S if cancel is not None else None
+
+    def escalate() -> bool:
+        # on timeout or cancel ask politely first and keep draining, so whatever the child
+        # prints while shutting down still lands in the capture; kill once the grace period
+        # is over. Returns True once the child has been killed.
+        nonlocal deadline, timed_out, stopping
+        now = time.monotonic()
+        if stopping:
+            if now < deadline:
+                return False
+            proc.kill()
+            return True
+        if now < deadline and not (cancel is not None and cancel.is_set()):
+            return False
+        timed_out = now >= deadline
+        stopping = True
+        proc.terminate()
+        deadline = now + _TERMINATE_GRACE_S
+        return False
 
-def run_shell_capture(command: str, cwd: Path, timeout_s: int) -> CommandResult:
+    def wait_s() -> float:
+        remaining = max(0.0, deadline - time.monotonic())
+        return remaining if tick is None else min(remaining, tick)
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(proc.stdout, selectors.EVENT_READ, stdout_buf)
+        selector.register(proc.stderr, selectors.EVENT_READ, stderr_buf)
+        while selector.get_map():
+            if escalate():
+                break
+            for key, _ in selector.select(wait_s()):
+                data = os.read(key.fd, 65536)
+                if not data:
+                    selector.unregister(key.fileobj)
+                    continue
+                key.data.feed(data)
+                if log_fd is not None:
+                    _write_all(log_fd, data)
+    proc.stdout.close()
+    proc.stderr.close()
+    # pipes can hit EOF while the child keeps running (it closed or redirected them);
+    # the deadline and the cancel event still apply to the process itself
+    while True:
+        try:
+            proc.wait(timeout=wait_s())
+            return timed_out
+        except subprocess.TimeoutExpired:
+            pass
+        if escalate():
+            proc.wait()
+            return timed_out
+
+
+def _stream_capture(
+    args: str | list[str],
+    cmd: list[str],
+    cwd: Path,
+    timeout_s: int,
+    *,
+    shell: bool = False,
+    log_path: Optional[Path] = None,
+    log_fd: Optional[int] = None,
+    tail_lines: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> CommandResult:
     start = time.monotonic()
+    stdout_buf = _OutputBuffer(tail_lines)
+    stderr_buf = _OutputBuffer(tail_lines)
+    proc = subprocess.Popen(args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=shell)
+    own_fd: Optional[int] = None
     try:
-        result = subprocess.run(
-            command,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=timeout_s,
-            shell=True,
-        )
-        duration = time.monotonic() - start
-        return CommandResult(
-            cmd=["sh", "-c", command],
-            cwd=cwd,
-            exit_code=result.returncode,
-            duration_s=duration,
-            stdout=result.stdout,
-            stderr=result.stderr,
-            timed_out=False,
-        )
-    except subprocess.TimeoutExpired as exc:
-        duration = time.monotonic() - start
-        stdout = _normalize_output(exc.stdout)
-        stderr = _normalize_output(exc.stderr)
-        return CommandResult(
-            cmd=["sh", "-c", command],
-            cwd=cwd,
-            exit_code=124,
-            duration_s=duration,
-            stdout=stdout,
-            stderr=stderr,
-            timed_out=True,
-        )
+        if log_fd is None and log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            own_fd = log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        timed_out = _pump_process(proc, timeout_s, stdout_buf, stderr_buf, log_fd, cancel)
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        if own_fd is not None:
+            os.close(own_fd)
+    return CommandResult(
+        cmd=cmd,
+        cwd=cwd,
+        exit_code=124 if timed_out else proc.returncode,
+        duration_s=time.monotonic() - start,
+        stdout=stdout_buf.text(),
+        stderr=stderr_buf.text(),
+        timed_out=timed_out,
+        log_path=log_path,
+    )
 
 
-def _extract_tail_lines(text: str, max_lines: int = 60) -> list[str]:
-    lines = text.splitlines()
-    if len(lines) <= max_lines:
-        return lines
-    return lines[-max_lines:]
+def run_cmd_capture(
+    cmd: list[str],
+    cwd: Path,
+    timeout_s: int,
+    *,
+    log_path: Optional[Path] = None,
+    log_fd: Optional[int] = None,
+    tail_lines: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> CommandResult:
+    return _stream_capture(
+        cmd, cmd, cwd, timeout_s, log_path=log_path, log_fd=log_fd, tail_lines=tail_lines, cancel=cancel
+    )
 
 
-def _extract_key_lines(lines: list[str], max_lines: int = 3) -> list[str]:
-    keywords = ["FAILED", "AssertionError", "Traceback", "short test summary info"]
-    picked = [line for line in lines if any(key in line for key in keywords)]
-    if not picked:
-        picked = lines[-max_lines:]
-    return picked[-max_lines:]
+def run_shell_capture(
+    command: str,
+    cwd: Path,
+    timeout_s: int,
+    *,
+    log_path: Optional[Path] = None,
+    log_fd: Optional[int] = None,
+    tail_lines: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> CommandResult:
+    return _stream_capture(
+        command,
+        ["sh", "-c", command],
+        cwd,
+        timeout_s,
+        shell=True,
+        log_path=log_path,
+        log_fd=log_fd,
+        tail_lines=tail_lines,
+        cancel=cancel,
+    )
 
 
-def _format_cmd(cmd: list[str]) -> str:
-    return " ".join(cmd)
+def _extract_tail_lines(text: str, max_lines: int = 60) -> list[str]:
+    # walk newlines backwards so only the tail is ever split into a list
+    pos = len(text) - 1 if text.endswith("\n") else len(text)
+    for _ in range(max_lines):
+        pos = text.rfind("\n", 0, pos)
+        if pos == -1:
+            return text.splitlines()[-max_lines:]
+    return text[pos + 1 :].splitlines()[-max_lines:]
+
+
+def _extract_tail_key_lines(text: str, tail_max: int = 60, key_max: int = 3) -> list[str]:
+    # last key_max keyword lines of the output tail (or the plain tail when none match);
+    # the tail is searched from the end and stops once key_max matches are found
+    tail = _extract_tail_lines(text, max_lines=tail_max)
+    if key_max <= 0:
+        return []
+    search = _RE_KEY_LINE.search
+    picked: list[str] = []
+    for line in reversed(tail):
+        if search(line):
+            picked.append(line)
+            if len(picked) == key_max:
+                break
+    if not picked:
+        return tail[-key_max:]
+    picked.reverse()
+    return picked
 
 
-def _select_python_executable(project_dir: Path) -> str:
-    venv_python = project_dir / ".venv" / "bin" / "python"
-    if venv_python.is_file():
-        return str(venv_python)
+def _select_python_executable(project_dir: Path, *, has_venv: bool = True) -> str:
+    if has_venv:
+        venv_python = os.path.join(project_dir, ".venv", "bin", "python")
+        if os.path.isfile(venv_python):
+            return venv_python
     return sys.executable
 
 
+def _probe_backend_root(backend_root: Path) -> tuple[bool, bool, bool]:
+    # one directory read instead of an exists() stat per marker
+    try:
+        with os.scandir(backend_root) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return False, False, False
+    return "pytest.ini" in names, "tests" in names, ".venv" in names
+
+
+def _backend_pytest_command(config: RunConfig, backend_root: Path) -> Optional[list[str]]:
+    has_pytest_ini, has_tests, has_venv = _probe_backend_root(backend_root)
+    if not has_pytest_ini and not has_tests:
+        return None
+    python_exec = config._python_exec
+    if python_exec is None:
+        python_exec = config._python_exec = _select_python_executable(backend_root, has_venv=has_venv)
+    if has_pytest_ini:
+        return [python_exec, "-m", "pytest", "-c", "./pytest.ini", "-q"]
+    return [python_exec, "-m", "pytest", "-q"]
+
+
+@lru_cache(maxsize=None)
+def _cached_which(which: Callable[[str], Optional[str]], name: str, search_path: Optional[str]) -> Optional[str]:
+    # search_path only keys the cache: a changed $PATH triggers a fresh lookup
+    return which(name)
+
+
+def _detect_node_npm() -> tuple[bool, bool]:
+    search_path = os.environ.get("PATH")
+    node_detected = _cached_which(shutil.which, "node", search_path) is not None
+    npm_detected = _cached_which(shutil.which, "npm", search_path) is not None
+    return node_detected, npm_detected
+
+
 def _select_backend_project_dir(project_dir: Path) -> Path:
-    backend_root = project_dir / "backend"
-    if (backend_root / "app" / "main.py").exists() or (backend_root / "pytest.ini").exists() or (backend_root / "tests").exists():
-        return backend_root
+    # plain os.path probes: these run on every invocation and avoid building Path objects
+    backend_root = os.path.join(project_dir, "backend")
+    exists = os.path.exists
+    join = os.path.join
+    if exists(join(backend_root, "app", "main.py")) or exists(join(backend_root, "pytest.ini")) or exists(join(backend_root, "tests")):
+        return project_dir / "backend"
     return project_dir
 
 
@@ -220,46 +547,51 @@ def _normalize_profile_name(profile: Optional[str]) -> Optional[str]:
 
 
 def _select_frontend_package_json(project_dir: Path) -> Optional[tuple[Path, Path]]:
-    frontend = project_dir / "frontend" / "package.json"
-    if frontend.exists():
-        return frontend, frontend.parent
-    root = project_dir / "package.json"
-    if root.exists():
-        return root, project_dir
+    if os.path.exists(os.path.join(project_dir, "frontend", "package.json")):
+        frontend_dir = project_dir / "frontend"
+        return frontend_dir / "package.json", frontend_dir
+    if os.path.exists(os.path.join(project_dir, "package.json")):
+        return project_dir / "package.json", project_dir
     return None
 
 
 def _select_frontend_pipeline_package_json(project_dir: Path) -> Optional[tuple[Path, Path]]:
-    frontend_package = project_dir / "frontend" / "package.json"
-    if frontend_package.exists():
-        return frontend_package, frontend_package.parent
-
-    root_package = project_dir / "package.json"
-    nextjs_markers = (
-        project_dir / "next.config.mjs",
-        project_dir / "next.config.js",
-        project_dir / "app",
-        project_dir / "pages",
-    )
-    if root_package.exists() and any(marker.exists() for marker in nextjs_markers):
-        return root_package, project_dir
+    if os.path.exists(os.path.join(project_dir, "frontend", "package.json")):
+        frontend_dir = project_dir / "frontend"
+        return frontend_dir / "package.json", frontend_dir
+
+    root = os.fspath(project_dir)
+    nextjs_markers = ("next.config.mjs", "next.config.js", "app", "pages")
+    if os.path.exists(os.path.join(root, "package.json")) and any(
+        os.path.exists(os.path.join(root, marker)) for marker in nextjs_markers
+    ):
+        return project_dir / "package.json", project_dir
 
     return None
 
 
-def _extract_failure_summary_lines(summary_path: Path, json_path: Optional[Path]) -> list[str]:
-    if summary_path.exists():
-        lines = summary_path.read_text(encoding="utf-8", errors="replace").splitlines()
-        start = next((i for i, line in enumerate(lines) if line.startswith("4) Failure summary:")), -1)
-        if start != -1:
-            end = next(
-                (i for i in range(start + 1, len(lines)) if lines[i].startswith("5) ")),
-                len(lines),
-            )
-            section = [line.strip() for line in lines[start + 1 : end] if line.strip()]
-            if section:
-                return section
-        return [line.strip() for line in lines[-10:] if line.strip()]
+def _extract_failure_summary_lines(summary_path: Optional[Path], json_path: Optional[Path]) -> list[str]:
+    if summary_path is not None and summary_path.exists():
+        # single pass: stop at the end of the failure section, keep only a short tail for the fallback
+        tail: deque[str] = deque(maxlen=10)
+        section: list[str] = []
+        state = "seek"
+        with summary_path.open(encoding="utf-8", errors="replace") as handle:
+            for raw in handle:
+                line = raw.rstrip("\n")
+                tail.append(line)
+                if state == "capture":
+                    if line.startswith("5) "):
+                        if section:
+                            return section
+                        state = "done"
+                    elif line.strip():
+                        section.append(line.strip())
+                elif state == "seek" and line.startswith("4) Failure summary:"):
+                    state = "capture"
+        if section:
+            return section
+        return [line.strip() for line in tail if line.strip()]
 
     if json_path is not None and json_path.exists():
         try:
@@ -272,37 +604,67 @@ def _extract_failure_summary_lines(summary_path: Path, json_path: Optional[Path]
     return []
 
 
-def _extract_failure_details(output: str) -> dict[str, Optional[str | list[str]]]:
-    lines = output.splitlines()
-    test_name: Optional[str] = None
-    file_path: Optional[str] = None
-
-    for line in lines:
-        if line.startswith("FAILED ") or line.startswith("ERROR "):
-            candidate = line.split(" ", 1)[1]
-            test_id = candidate.split(" - ", 1)[0].strip()
-            test_name = test_id
-            if "::" in test_id:
-                file_path = test_id.split("::", 1)[0]
-            else:
-                file_path = test_id
-            break
+def _extract_head_lines(text: str, start: int, max_lines: int) -> list[str]:
+    end = start
+    for _ in range(max_lines):
+        end = text.find("\n", end) + 1
+        if end == 0:
+            return text[start:].splitlines()[:max_lines]
+    return text[start:end].splitlines()[:max_lines]
 
-    if file_path is None:
-        match = re.search(r'File "([^"]+)"', output)
-        if match:
-            file_path = match.group(1)
 
-    trace_idx = next((i for i, line in enumerate(lines) if "Traceback" in line), -1)
-    stack_top = lines[trace_idx : trace_idx + 6] if trace_idx != -1 else []
-    stack_bottom = lines[-6:] if lines else []
+def _scan_failure_output(output: str) -> tuple[dict[str, Optional[str | list[str]]], list[str]]:
+    # one pass over the output collects the failing test, file hints and traceback position
+    test_name: Optional[str] = None
+    first_file: Optional[str] = None
+    trace_pos = -1
+    file_hits: list[str] = []
+    py_hits: list[str] = []
+    seen_files: set[str] = set()
+    seen_py: set[str] = set()
+
+    for match in _RE_FAILURE_SCAN.finditer(output):
+        kind = match.lastgroup
+        if kind == "test":
+            if test_name is None:
+                test_name = match.group("test").strip()
+        elif kind == "file":
+            hit = match.group("file")
+            if first_file is None:
+                first_file = hit
+            if hit not in seen_files:
+                seen_files.add(hit)
+                file_hits.append(hit)
+        elif kind == "pyfile":
+            hit = match.group("pyfile")
+            if hit not in seen_py:
+                seen_py.add(hit)
+                py_hits.append(hit)
+        elif trace_pos == -1:
+            trace_pos = match.start()
+
+    if test_name is not None:
+        file_path: Optional[str] = test_name.split("::", 1)[0]
+    else:
+        file_path = first_file
 
-    return {
+    stack_top: list[str] = []
+    if trace_pos != -1:
+        line_start = max(output.rfind("\n", 0, trace_pos), output.rfind("\r", 0, trace_pos)) + 1
+        stack_top = _extract_head_lines(output, line_start, 6)
+
+    details: dict[str, Optional[str | list[str]]] = {
         "test_name": test_name,
         "file_path": file_path,
         "stack_top": stack_top,
-        "stack_bottom": stack_bottom,
+        "stack_bottom": _extract_tail_lines(output, max_lines=6),
     }
+    # File "..." hits come first, matching the order the hints were always reported in
+    return details, file_hits + [hit for hit in py_hits if hit not in seen_files]
+
+
+def _extract_failure_details(output: str) -> dict[str, Optional[str | list[str]]]:
+    return _scan_failure_output(output)[0]
 
 
 def _build_failure_prompt(
@@ -316,51 +678,52 @@ def _build_failure_prompt(
     stack_top = details.get("stack_top") or []
     stack_bottom = details.get("stack_bottom") or []
 
-    summary_block = "\n".join(f"- {line}" for line in summary_lines) if summary_lines else "- (요약 없음)"
     files_block = file_path if isinstance(file_path, str) else "확인 필요"
 
-    stack_top_block = "\n".join(stack_top) if stack_top else "(스택트레이스 상단 없음)"
-    stack_bottom_block = "\n".join(stack_bottom) if stack_bottom else "(스택트레이스 하단 없음)"
-
-    return (
-        "# 재현 커맨드\n"
-        f"{command}\n\n"
-        "# 실패 요약\n"
-        f"{summary_block}\n\n"
-        "# 실패 지점\n"
-        f"- 실패한 테스트: {test_name}\n"
-        f"- 파일 경로: {files_block}\n"
-        "- 스택트레이스(상단):\n"
-        f"{stack_top_block}\n"
-        "- 스택트레이스(하단):\n"
-        f"{stack_bottom_block}\n\n"
-        "# 수정 지시문\n"
-        "- 목표: python -m pytest -q 통과\n"
-        f"- 수정 대상: {files_block}\n"
-        "- 변경 범위를 최소화하라\n\n"
-        "# 완료 조건 체크리스트\n"
-        "- [ ] python -m pytest -q 통과\n"
-        "- [ ] 기존 기능 영향 없음\n"
-    )
+    # one flat list and a single join instead of per-section joins nested into the text
+    parts = ["# 재현 커맨드", command, "", "# 실패 요약"]
+    if summary_lines:
+        parts.extend(f"- {line}" for line in summary_lines)
+    else:
+        parts.append("- (요약 없음)")
+    parts += ["", "# 실패 지점", f"- 실패한 테스트: {test_name}", f"- 파일 경로: {files_block}", "- 스택트레이스(상단):"]
+    parts.extend(stack_top or ["(스택트레이스 상단 없음)"])
+    parts.append("- 스택트레이스(하단):")
+    parts.extend(stack_bottom or ["(스택트레이스 하단 없음)"])
+    parts += [
+        "",
+        "# 수정 지시문",
+        "- 목표: python -m pytest -q 통과",
+        f"- 수정 대상: {files_block}",
+        "- 변경 범위를 최소화하라",
+        "",
+        _PROMPT_CHECKLIST,
+    ]
+    return "\n".join(parts)
 
 
 def write_failure_prompt(
     config: RunConfig,
     result: RunResult,
     command_override: Optional[str] = None,
+    summary_lines: Optional[Sequence[str]] = None,
 ) -> Optional[Path]:
-    if result.overall_exit_code == 0:
+    # write_logs=False runs leave nothing on disk, the prompt included
+    if result.overall_exit_code == 0 or not config.write_logs:
         return None
 
     command = command_override or config.command
-    summary_lines = _extract_failure_summary_lines(result.summary_path, result.json_summary_path)
+    if summary_lines:
+        # the summary writers pass their failure section directly; only external callers re-read the files
+        summary_lines = [line.strip() for line in summary_lines if line.strip()]
+    else:
+        summary_lines = _extract_failure_summary_lines(result.summary_path, result.json_summary_path)
 
     output = ""
-    files_hint: list[str] = []
     if result.profile and result.profile_steps:
         failing = next((step for step in result.profile_steps if step.status == "FAIL"), None)
         if failing:
-            output = "\n".join([failing.stdout, failing.stderr]).strip()
+            output = failing.combined
     elif result.backend.status == "FAIL":
         output = result.backend.output
     elif result.frontend.status == "FAIL":
@@ -368,32 +731,18 @@ def write_failure_prompt(
             f"{step.stdout}\n{step.stderr}" for step in result.frontend.steps if step.exit_code != 0
         )
 
-    files_hint = []
-    for match in re.findall(r'File "([^"]+)"', output):
-        files_hint.append(match)
-    for match in re.findall(r"^(.+?\.py):\d+:", output, flags=re.MULTILINE):
-        files_hint.append(match)
-    files_hint = list(dict.fromkeys(files_hint))
-
-    details = _extract_failure_details(output)
+    details, files_hint = _scan_failure_output(output)
     prompt_text = _build_failure_prompt(command, summary_lines, details, files_hint)
 
     prompt_path = config.log_dir / f"{result.timestamp}.prompt.md"
-    prompt_path.write_text(prompt_text, encoding="utf-8")
+    _write_file_bytes(prompt_path, prompt_text.encode("utf-8"))
     return prompt_path
 
 
 def run_backend_pytest(config: RunConfig) -> BackendResult:
     backend_root = _select_backend_project_dir(config.project_dir)
-    pytest_ini = backend_root / "pytest.ini"
-    tests_dir = backend_root / "tests"
-    python_exec = _select_python_executable(backend_root)
-
-    if pytest_ini.exists():
-        cmd = [python_exec, "-m", "pytest", "-c", "./pytest.ini", "-q"]
-    elif tests_dir.exists():
-        cmd = [python_exec, "-m", "pytest", "-q"]
-    else:
+    cmd = _backend_pytest_command(config, backend_root)
+    if cmd is None:
         return BackendResult(
             status="SKIPPED",
             cmd=None,
@@ -406,14 +755,13 @@ def run_backend_pytest(config: RunConfig) -> BackendResult:
         )
 
     result = run_cmd_capture(cmd, backend_root, config.timeout_s)
-    combined = (result.stdout + "\n" + result.stderr).strip()
-    tail_lines = _extract_tail_lines(combined)
-    summary_lines = _extract_key_lines(tail_lines)
-
+    combined = result.combined
     status = "PASS" if result.exit_code == 0 else "FAIL"
+    # key lines only feed failure summaries; a green run never reads them
+    summary_lines = _extract_tail_key_lines(combined) if status == "FAIL" else []
     return BackendResult(
         status=status,
-        cmd=_format_cmd(cmd),
+        cmd=result.cmd_str,
         cwd=str(backend_root),
         exit_code=result.exit_code,
         duration_s=result.duration_s,
@@ -422,21 +770,35 @@ def run_backend_pytest(config: RunConfig) -> BackendResult:
     )
 
 
-def _read_package_scripts(package_json: Path) -> dict[str, str]:
-    data = json.loads(package_json.read_text(encoding="utf-8"))
+@lru_cache(maxsize=32)
+def _parse_package_scripts(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    # mtime_ns/size only key the cache so an edited package.json is parsed again
+    data = loads(Path(path).read_bytes())
     scripts = data.get("scripts") or {}
-    if isinstance(scripts, dict):
-        return {k: str(v) for k, v in scripts.items()}
-    return {}
+    if not isinstance(scripts, dict):
+        return {}
+    if all(isinstance(value, str) for value in scripts.values()):
+        return scripts
+    return {k: str(v) for k, v in scripts.items()}
 
 
-def _summarize_step_output(stdout: str, stderr: str, max_lines: int = 40) -> list[str]:
-    combined = (stdout + "\n" + stderr).strip()
+def _read_package_scripts(package_json: Path) -> dict[str, str]:
+    stat = package_json.stat()
+    return dict(_parse_package_scripts(str(package_json), stat.st_mtime_ns, stat.st_size))
+
+
+def _summarize_step_output(combined: str, max_lines: int = 40) -> list[str]:
     if not combined:
         return []
     return _extract_tail_lines(combined, max_lines=max_lines)
 
 
+def _failed_step_summary(result: CommandResult) -> list[str]:
+    if result.exit_code == 0:
+        return []
+    return _summarize_step_output(result.combined)
+
+
 def _is_frontend_noise_line(line: str) -> bool:
     lower = line.lower().strip()
     if not lower:
@@ -462,9 +824,9 @@ def _is_frontend_noise_line(line: str) -> bool:
 
 def _has_explicit_error(line: str) -> bool:
     lower = line.lower()
-    if re.search(r"\b0 errors?\b", lower):
+    if _RE_ZERO_ERRORS.search(lower):
         return False
-    if re.search(r"\bno\b[^.\n]*\berrors?\b", lower):
+    if _RE_NO_ERRORS.search(lower):
         return False
     if "parsing error" in lower:
         return True
@@ -472,24 +834,24 @@ def _has_explicit_error(line: str) -> bool:
         return True
     if "npm err!" in lower:
         return True
-    if re.search(r"\bts\d{4}\b", lower):
+    if _RE_TS_CODE.search(lower):
         return True
-    if re.search(r"\berrors?\b", lower):
+    if _RE_ERRORS.search(lower):
         return True
-    if re.search(r"\berror:\b", lower):
+    if _RE_ERROR_COLON.search(lower):
         return True
     return False
 
 
 def _has_warning(line: str) -> bool:
     lower = line.lower()
-    if re.search(r"\b0 warnings?\b", lower):
+    if _RE_ZERO_WARNINGS.search(lower):
         return False
-    if re.search(r"\bno\b[^.\n]*\bwarnings?\b", lower):
+    if _RE_NO_WARNINGS.search(lower):
         return False
-    if re.search(r"\bwarnings?\b", lower):
+    if _RE_WARNINGS.search(lower):
         return True
-    if re.search(r"\bwarning:\b", lower):
+    if _RE_WARNING_COLON.search(lower):
         return True
     return False
 
@@ -510,8 +872,8 @@ def _classify_frontend_lint(stdout: str, stderr: str) -> tuple[str, list[str]]:
     filtered: list[str] = []
     seen: set[str] = set()
     for raw in combined:
-        line = re.sub(r"\x1b\[[0-9;]*[a-zA-Z]", "", str(raw))
-        line = re.sub(r"\s+", " ", line).strip()
+        line = _RE_ANSI_ESCAPE.sub("", str(raw))
+        line = _RE_WHITESPACE.sub(" ", line).strip()
         if not line or _is_frontend_noise_line(line):
             continue
         if line in seen:
@@ -548,6 +910,10 @@ def _profile_step_from_command(name: str, cmd: str, result: CommandResult) -> Pr
     )
 
 
+def _profile_step_payloads(steps: Sequence[ProfileStepResult]) -> list[dict]:
+    return [dict(zip(_PROFILE_STEP_KEYS, _profile_step_fields(step))) for step in steps]
+
+
 def _profile_step_skip(name: str, cmd: Optional[str], reason: Optional[str] = None) -> ProfileStepResult:
     stdout = reason or ""
     return ProfileStepResult(
@@ -581,39 +947,69 @@ def _profile_step_skip_from_result(
     )
 
 
-def _failure_summary_from_output(stdout: str, stderr: str, max_lines: int = 5) -> list[str]:
-    combined = (stdout + "\n" + stderr).strip()
+def _failure_summary_from_output(combined: str, max_lines: int = 5) -> list[str]:
     if not combined:
         return []
-    tail = _extract_tail_lines(combined)
-    return _extract_key_lines(tail, max_lines=max_lines)
+    return _extract_tail_key_lines(combined, key_max=max_lines)
 
 
 def _collect_failure_summary(steps: Sequence[ProfileStepResult], max_lines: int = 10) -> list[str]:
     summary: list[str] = []
     for step in steps:
         if step.status == "FAIL":
-            summary.extend(_failure_summary_from_output(step.stdout, step.stderr, max_lines=5))
+            summary.extend(_failure_summary_from_output(step.combined, max_lines=5))
     if not summary:
         return []
     return summary[:max_lines]
 
 
+def _run_checks_concurrently(
+    names: Sequence[str],
+    run_one: Callable[[str, threading.Event], _T],
+    failed: Callable[[str, _T], bool],
+) -> dict[str, _T]:
+    # read-only check scripts (lint/typecheck/test) don't depend on each other; callers still
+    # walk the results in their original order, so once every check up to the first failing
+    # one is in, the rest cannot change the outcome: they are cancelled (running children are
+    # terminated through the shared event) and left out of the returned dict.
+    # Plain threads are enough here: each worker just sits in _pump_process's selector loop,
+    # which enforces timeout_s and watches the cancel event, and run_cmd_capture stays the
+    # single (synchronous, monkeypatchable) capture path.
+    if len(names) < 2:
+        return {}
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    cancel = threading.Event()
+    results: dict[str, _T] = {}
+    executor = ThreadPoolExecutor(max_workers=min(_MAX_CHECK_WORKERS, len(names)))
+    try:
+        futures = {executor.submit(run_one, name, cancel): name for name in names}
+        pending = set(futures)
+        decided = 0
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+            while decided < len(names) and names[decided] in results:
+                name = names[decided]
+                if failed(name, results[name]):
+                    cancel.set()
+                    return {key: results[key] for key in names[: decided + 1]}
+                decided += 1
+        return results
+    finally:
+        cancel.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def run_python_pytest_profile(config: RunConfig) -> list[ProfileStepResult]:
     backend_root = _select_backend_project_dir(config.project_dir)
-    pytest_ini = backend_root / "pytest.ini"
-    tests_dir = backend_root / "tests"
-    python_exec = _select_python_executable(backend_root)
-
-    if pytest_ini.exists():
-        cmd = [python_exec, "-m", "pytest", "-c", "./pytest.ini", "-q"]
-    elif tests_dir.exists():
-        cmd = [python_exec, "-m", "pytest", "-q"]
-    else:
+    cmd = _backend_pytest_command(config, backend_root)
+    if cmd is None:
         return [_profile_step_skip("pytest", None, "No pytest.ini or tests/ directory.")]
 
     result = run_cmd_capture(cmd, backend_root, config.timeout_s)
-    return [_profile_step_from_command("pytest", _format_cmd(cmd), result)]
+    return [_profile_step_from_command("pytest", result.cmd_str, result)]
 
 
 def run_node_vite_profile(config: RunConfig) -> list[ProfileStepResult]:
@@ -622,8 +1018,7 @@ def run_node_vite_profile(config: RunConfig) -> list[ProfileStepResult]:
         return [_profile_step_skip("detect", None, "package.json not found.")]
     package_json, work_dir = selected
 
-    node_detected = shutil.which("node") is not None
-    npm_detected = shutil.which("npm") is not None
+    node_detected, npm_detected = _detect_node_npm()
     if not node_detected or not npm_detected:
         return [_profile_step_skip("detect-tools", "node/npm", "node/npm not available.")]
 
@@ -673,12 +1068,18 @@ def run_node_vite_profile(config: RunConfig) -> list[ProfileStepResult]:
             steps.append(_profile_step_from_command("install-fallback", fallback_cmd, fallback_result))
 
     order = ["lint", "typecheck", "test", "build"]
-    for name in order:
+    available = [name for name in order if name in scripts]
+    missing = [name for name in order if name not in scripts]
+    if missing:
+        steps.append(_profile_step_skip("scripts", None, f"script not found: {', '.join(missing)}"))
+    prefetched = _run_checks_concurrently(
+        [name for name in available if name != "build"],
+        lambda name, cancel: run_shell_capture(f"npm run {name}", work_dir, config.timeout_s, cancel=cancel),
+        lambda _name, result: result.exit_code != 0,
+    )
+    for name in available:
         cmd = f"npm run {name}"
-        if name not in scripts:
-            steps.append(_profile_step_skip(name, cmd, "script not found"))
-            continue
-        result = run_shell_capture(cmd, work_dir, config.timeout_s)
+        result = prefetched.get(name) or run_shell_capture(cmd, work_dir, config.timeout_s)
         steps.append(_profile_step_from_command(name, cmd, result))
         if result.exit_code != 0:
             return steps
@@ -690,16 +1091,43 @@ def run_generic_shell_profile(config: RunConfig) -> list[ProfileStepResult]:
     cmds = config.cmds or []
     if not cmds:
         return [_profile_step_skip("cmds", None, "No --cmd provided.")]
+    if config.parallel_cmds and len(cmds) > 1:
+        return _run_shell_cmds_parallel(config, cmds)
     steps: list[ProfileStepResult] = []
     for idx, cmd in enumerate(cmds, start=1):
         name = f"cmd-{idx}"
         result = run_shell_capture(cmd, config.project_dir, config.timeout_s)
         steps.append(_profile_step_from_command(name, cmd, result))
-        if result.exit_code != 0:
+        if result.exit_code != 0 and config.fail_fast:
             break
     return steps
 
 
+def _run_shell_cmds_parallel(config: RunConfig, cmds: list[str]) -> list[ProfileStepResult]:
+    # results are reported in --cmd order; with fail_fast, commands not yet started when the
+    # first failure lands are cancelled and left out (already running ones finish normally)
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    results: dict[int, CommandResult] = {}
+    with ThreadPoolExecutor(max_workers=min(max(os.cpu_count() or 1, _MAX_CHECK_WORKERS), len(cmds))) as executor:
+        futures = {
+            executor.submit(run_shell_capture, cmd, config.project_dir, config.timeout_s): idx
+            for idx, cmd in enumerate(cmds)
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            result = future.result()
+            results[futures[future]] = result
+            if config.fail_fast and result.exit_code != 0:
+                for pending in futures:
+                    pending.cancel()
+    return [
+        _profile_step_from_command(f"cmd-{idx + 1}", cmds[idx], results[idx])
+        for idx in sorted(results)
+    ]
+
+
 def run_frontend_pipeline(config: RunConfig) -> FrontendResult:
     selected = _select_frontend_pipeline_package_json(config.project_dir)
     if selected is None:
@@ -714,8 +1142,7 @@ def run_frontend_pipeline(config: RunConfig) -> FrontendResult:
         )
     package_json, frontend_dir = selected
 
-    node_detected = shutil.which("node") is not None
-    npm_detected = shutil.which("npm") is not None
+    node_detected, npm_detected = _detect_node_npm()
     if not node_detected or not npm_detected:
         return FrontendResult(
             status="SKIPPED",
@@ -752,6 +1179,80 @@ def run_frontend_pipeline(config: RunConfig) -> FrontendResult:
             reason="no scripts (lint/test/build) found.",
         )
 
+    if not config.write_logs:
+        return _run_frontend_steps(config, frontend_dir, scripts, wanted, node_detected, npm_detected, None)
+    config.log_dir.mkdir(parents=True, exist_ok=True)
+    # install steps only keep their tail in memory, so the full output is teed into a file
+    # private to this run; write_log_and_summary appends it to the run log and removes it
+    live_fd, live_name = tempfile.mkstemp(prefix="frontend_", suffix=".live.log", dir=config.log_dir)
+    with open(live_fd, "wb", buffering=0) as live_log:
+        result = _run_frontend_steps(
+            config, frontend_dir, scripts, wanted, node_detected, npm_detected, live_log.fileno()
+        )
+    result.output_log = Path(live_name)
+    return result
+
+
+def _fold_live_log(log_path: Path, live_log: Path) -> None:
+    with log_path.open("ab") as out, live_log.open("rb") as live:
+        out.write(b"\n== Frontend output ==\n")
+        shutil.copyfileobj(live, out, 1 << 20)
+    live_log.unlink()
+
+
+def _run_frontend_step(
+    name: str,
+    cmd: list[str],
+    frontend_dir: Path,
+    timeout_s: int,
+    live_fd: Optional[int],
+    tail_lines: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> FrontendStepResult:
+    if live_fd is not None:
+        _write_all(live_fd, f"== {name}: {shlex.join(cmd)} ==\n".encode("utf-8"))
+    result = run_cmd_capture(cmd, frontend_dir, timeout_s, log_fd=live_fd, tail_lines=tail_lines, cancel=cancel)
+    return FrontendStepResult(
+        name=name,
+        cmd=cmd,
+        exit_code=result.exit_code,
+        duration_s=result.duration_s,
+        stdout=result.stdout,
+        stderr=result.stderr,
+        summary_lines=_failed_step_summary(result),
+        timed_out=result.timed_out,
+        cmd_str=result.cmd_str,
+    )
+
+
+def _frontend_check_failed(name: str, step: FrontendStepResult) -> bool:
+    # mirrors the fail-fast checks in _run_frontend_steps: lint warnings never stop the run
+    if name == "lint":
+        lint_status, _ = _classify_frontend_lint(step.stdout, step.stderr)
+        if lint_status == "WARNING":
+            return False
+        return lint_status == "FAIL" or step.exit_code != 0
+    return step.exit_code != 0
+
+
+def _write_step_output(live_fd: int, step: FrontendStepResult) -> None:
+    # steps run concurrently are not teed live; their captured output is appended afterwards
+    parts = [f"== {step.name}: {step.cmd_str} ==\n"]
+    for text in (step.stdout, step.stderr):
+        if text:
+            parts.append(text if text.endswith("\n") else text + "\n")
+    _write_all(live_fd, "".join(parts).encode("utf-8"))
+
+
+def _run_frontend_steps(
+    config: RunConfig,
+    frontend_dir: Path,
+    scripts: dict[str, str],
+    wanted: list[str],
+    node_detected: bool,
+    npm_detected: bool,
+    live_fd: Optional[int],
+) -> FrontendResult:
     steps: list[FrontendStepResult] = []
     summary_lines: list[str] = []
     lint_warning_lines: list[str] = []
@@ -759,38 +1260,23 @@ def run_frontend_pipeline(config: RunConfig) -> FrontendResult:
 
     if not config.no_install:
         install_attempted = True
-        install_cmd = ["npm", "ci"]
-        install_result = run_cmd_capture(install_cmd, frontend_dir, config.timeout_s)
-        steps.append(
-            FrontendStepResult(
-                name="install",
-                cmd=install_cmd,
-                exit_code=install_result.exit_code,
-                duration_s=install_result.duration_s,
-                stdout=install_result.stdout,
-                stderr=install_result.stderr,
-                summary_lines=_summarize_step_output(install_result.stdout, install_result.stderr),
-                timed_out=install_result.timed_out,
-            )
+        # install logs dominate output volume; keep only their tail, the live log has the rest
+        install_step = _run_frontend_step(
+            "install", ["npm", "ci"], frontend_dir, config.timeout_s, live_fd, tail_lines=_INSTALL_TAIL_LINES
         )
-        if install_result.exit_code != 0:
-            fallback_cmd = ["npm", "install"]
-            fallback_result = run_cmd_capture(fallback_cmd, frontend_dir, config.timeout_s)
-            steps.append(
-                FrontendStepResult(
-                    name="install-fallback",
-                    cmd=fallback_cmd,
-                    exit_code=fallback_result.exit_code,
-                    duration_s=fallback_result.duration_s,
-                    stdout=fallback_result.stdout,
-                    stderr=fallback_result.stderr,
-                    summary_lines=_summarize_step_output(fallback_result.stdout, fallback_result.stderr),
-                    timed_out=fallback_result.timed_out,
-                )
+        steps.append(install_step)
+        if install_step.exit_code != 0:
+            fallback_result = _run_frontend_step(
+                "install-fallback",
+                ["npm", "install"],
+                frontend_dir,
+                config.timeout_s,
+                live_fd,
+                tail_lines=_INSTALL_TAIL_LINES,
             )
+            steps.append(fallback_result)
             if fallback_result.exit_code != 0:
-                combined = (fallback_result.stdout + "\n" + fallback_result.stderr).strip()
-                summary_lines = _extract_key_lines(_extract_tail_lines(combined))
+                summary_lines = _extract_tail_key_lines(fallback_result.combined)
                 return FrontendResult(
                     status="FAIL",
                     node_detected=node_detected,
@@ -805,25 +1291,29 @@ def run_frontend_pipeline(config: RunConfig) -> FrontendResult:
     if "typecheck" not in wanted and tsc_path.exists():
         wanted.insert(1, "typecheck")
 
-    for script_name in wanted:
+    def script_cmd(script_name: str) -> list[str]:
         if script_name == "typecheck" and script_name not in scripts:
-            cmd = [str(tsc_path), "--noEmit"]
-        else:
-            cmd = ["npm", "run", script_name]
-        step_result = run_cmd_capture(cmd, frontend_dir, config.timeout_s)
-        summary = _summarize_step_output(step_result.stdout, step_result.stderr)
-        steps.append(
-            FrontendStepResult(
-                name=script_name,
-                cmd=cmd,
-                exit_code=step_result.exit_code,
-                duration_s=step_result.duration_s,
-                stdout=step_result.stdout,
-                stderr=step_result.stderr,
-                summary_lines=summary,
-                timed_out=step_result.timed_out,
+            return [str(tsc_path), "--noEmit"]
+        return ["npm", "run", script_name]
+
+    prefetched = _run_checks_concurrently(
+        [name for name in wanted if name != "build"],
+        lambda name, cancel: _run_frontend_step(
+            name, script_cmd(name), frontend_dir, config.timeout_s, None, cancel=cancel
+        ),
+        _frontend_check_failed,
+    )
+    if live_fd is not None:
+        for step in prefetched.values():
+            _write_step_output(live_fd, step)
+
+    for script_name in wanted:
+        step_result = prefetched.get(script_name)
+        if step_result is None:
+            step_result = _run_frontend_step(
+                script_name, script_cmd(script_name), frontend_dir, config.timeout_s, live_fd
             )
-        )
+        steps.append(step_result)
         if script_name == "lint":
             lint_status, lint_summary = _classify_frontend_lint(step_result.stdout, step_result.stderr)
             if lint_status == "FAIL":
@@ -842,8 +1332,7 @@ def run_frontend_pipeline(config: RunConfig) -> FrontendResult:
                         lint_warning_lines.append(line)
                 continue
             if step_result.exit_code != 0:
-                combined = (step_result.stdout + "\n" + step_result.stderr).strip()
-                summary_lines = _extract_key_lines(_extract_tail_lines(combined))
+                summary_lines = _extract_tail_key_lines(step_result.combined)
                 return FrontendResult(
                     status="FAIL",
                     node_detected=node_detected,
@@ -856,8 +1345,7 @@ def run_frontend_pipeline(config: RunConfig) -> FrontendResult:
             continue
 
         if step_result.exit_code != 0:
-            combined = (step_result.stdout + "\n" + step_result.stderr).strip()
-            summary_lines = _extract_key_lines(_extract_tail_lines(combined))
+            summary_lines = _extract_tail_key_lines(step_result.combined)
             return FrontendResult(
                 status="FAIL",
                 node_detected=node_detected,
@@ -895,13 +1383,18 @@ def _compute_exit_code(config: RunConfig, backend: BackendResult, frontend: Fron
 
 
 def _profile_overall_status_reason(steps: Sequence[ProfileStepResult]) -> tuple[str, Optional[str]]:
-    has_fail = any(step.status == "FAIL" for step in steps)
-    if has_fail:
-        return "FAIL", None
-    has_ok = any(step.status == "OK" for step in steps)
+    # one pass: any FAIL wins outright, otherwise remember whether OK/SKIP steps were seen
+    has_ok = has_skip = False
+    for step in steps:
+        step_status = step.status
+        if step_status == "FAIL":
+            return "FAIL", None
+        if step_status == "OK":
+            has_ok = True
+        elif step_status == "SKIP":
+            has_skip = True
     if has_ok:
         return "SUCCESS", None
-    has_skip = any(step.status == "SKIP" for step in steps)
     if has_skip:
         reason = _extract_skip_reason(steps)
         return "SKIP", reason
@@ -949,27 +1442,17 @@ def _build_result_text(
         "Steps:",
     ]
     step_lines = [
-        f"- {step.name}: {step.status} ({step.cmd or 'N/A'})" for step in list(steps)[:10]
+        f"- {step.name}: {step.status} ({step.cmd or 'N/A'})" for step in steps[:10]
     ]
     lines.extend(step_lines or ["- (none)"])
 
-    lines.extend(
-        [
-            "",
-            "Failure summary:",
-        ]
-    )
+    lines += ["", "Failure summary:"]
     if failure_summary:
-        lines.extend([f"- {line}" for line in list(failure_summary)[:5]])
+        lines.extend(f"- {line}" for line in failure_summary[:5])
     else:
         lines.append("- (none)")
 
-    lines.extend(
-        [
-            "",
-            "Next actions:",
-        ]
-    )
+    lines += ["", "Next actions:"]
     if status == "SUCCESS":
         lines.append("- No action required.")
     else:
@@ -989,6 +1472,7 @@ def _write_run_result_files(
     failure_summary: Sequence[str],
     warning_summary: Sequence[str],
     reason: Optional[str],
+    step_payloads: Optional[list[dict]] = None,
 ) -> tuple[Path, Path]:
     result_dir = project_dir / ".archmind"
     result_dir.mkdir(parents=True, exist_ok=True)
@@ -1000,23 +1484,14 @@ def _write_run_result_files(
         "profile": profile,
         "project_dir": str(project_dir),
         "timestamp": timestamp,
-        "steps": [
-            {
-                "name": step.name,
-                "status": step.status,
-                "cmd": step.cmd,
-                "exit_code": step.exit_code,
-                "duration_s": step.duration_s,
-            }
-            for step in steps
-        ],
+        "steps": step_payloads if step_payloads is not None else _profile_step_payloads(steps),
         "failure_summary": list(failure_summary)[:10],
         "warning_summary": list(warning_summary)[:10],
     }
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    txt_path.write_text(
-        _build_result_text(status, profile, project_dir, timestamp, steps, failure_summary, reason),
-        encoding="utf-8",
+    _replace_file_if_changed(json_path, dumps_indented(payload))
+    _replace_file_if_changed(
+        txt_path,
+        _build_result_text(status, profile, project_dir, timestamp, steps, failure_summary, reason).encode("utf-8"),
     )
     return json_path, txt_path
 
@@ -1026,87 +1501,98 @@ def write_profile_log_and_summary(
     profile: str,
     steps: Sequence[ProfileStepResult],
 ) -> RunResult:
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+    if not config.write_logs:
+        status, _ = _profile_overall_status_reason(steps)
+        return RunResult(
+            backend=_SKIPPED_BACKEND_PROFILE,
+            frontend=_SKIPPED_FRONTEND_PROFILE,
+            overall_exit_code=0 if status in ("SUCCESS", "SKIP") else 1,
+            log_path=None,
+            summary_path=None,
+            json_summary_path=None,
+            timestamp=timestamp,
+            profile=profile,
+            profile_steps=list(steps),
+        )
     config.log_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = config.log_dir / f"run_{timestamp}.log"
     summary_path = config.log_dir / f"run_{timestamp}.summary.txt"
     json_path = config.log_dir / f"run_{timestamp}.summary.json" if config.json_summary else None
+    project_dir_s = str(config.project_dir)
 
-    log_lines: list[str] = []
-    log_lines.append("== Run Log ==")
-    log_lines.append(f"timestamp: {timestamp}")
-    log_lines.append(f"project_dir: {config.project_dir}")
-    log_lines.append(f"profile: {profile}")
-    log_lines.append("")
-    log_lines.append("== Steps ==")
+    log_lines = [
+        "== Run Log ==",
+        f"timestamp: {timestamp}",
+        f"project_dir: {project_dir_s}",
+        f"profile: {profile}",
+        "",
+        "== Steps ==",
+    ]
     for step in steps:
-        log_lines.append(f"-- step: {step.name}")
-        log_lines.append(f"status: {step.status}")
-        log_lines.append(f"cmd: {step.cmd or 'N/A'}")
-        log_lines.append(f"exit_code: {step.exit_code if step.exit_code is not None else 'N/A'}")
-        log_lines.append(f"duration_s: {step.duration_s:.2f}")
+        log_lines += [
+            f"-- step: {step.name}",
+            f"status: {step.status}",
+            f"cmd: {step.cmd or 'N/A'}",
+            f"exit_code: {step.exit_code if step.exit_code is not None else 'N/A'}",
+            f"duration_s: {step.duration_s:.2f}",
+        ]
         if step.stdout:
-            log_lines.append("STDOUT:")
-            log_lines.append(step.stdout)
+            log_lines += ["STDOUT:", step.stdout]
         if step.stderr:
-            log_lines.append("STDERR:")
-            log_lines.append(step.stderr)
-    log_path.write_text("\n".join(log_lines).strip() + "\n", encoding="utf-8")
+            log_lines += ["STDERR:", step.stderr]
+    finish_log = _start_log_write(log_path, log_lines)
 
     status, reason = _profile_overall_status_reason(steps)
     failure_summary = _collect_failure_summary(steps, max_lines=10)
 
-    summary_lines: list[str] = []
-    summary_lines.append("1) Run meta:")
-    summary_lines.append(f"- project_dir: {config.project_dir}")
-    summary_lines.append(f"- timestamp: {timestamp}")
-    summary_lines.append(f"- command: {config.command}")
-    summary_lines.append(f"- profile: {profile}")
-    summary_lines.append("2) Steps:")
+    failure_section: list[str] = []
+    summary_lines = [
+        "1) Run meta:",
+        f"- project_dir: {project_dir_s}",
+        f"- timestamp: {timestamp}",
+        f"- command: {config.command}",
+        f"- profile: {profile}",
+        "2) Steps:",
+    ]
     if steps:
-        for step in steps:
-            summary_lines.append(
-                f"- {step.name}: {step.status} exit_code={step.exit_code if step.exit_code is not None else 'N/A'}"
-            )
+        summary_lines.extend(
+            f"- {step.name}: {step.status} exit_code={step.exit_code if step.exit_code is not None else 'N/A'}"
+            for step in steps
+        )
     else:
         summary_lines.append("- steps: none")
 
     if status != "SUCCESS":
+        failure_section = [f"- {line}" for line in failure_summary]
         summary_lines.append("4) Failure summary:")
-        for line in failure_summary:
-            summary_lines.append(f"- {line}")
+        summary_lines.extend(failure_section)
         summary_lines.append("5) Next actions:")
         if failure_summary:
             summary_lines.append(f"- Investigate: {failure_summary[0]}")
         summary_lines.append("- Check run_logs output for the failing step.")
 
-    summary_path.write_text("\n".join(summary_lines).strip() + "\n", encoding="utf-8")
+    _write_file_bytes(summary_path, ("\n".join(summary_lines).strip() + "\n").encode("utf-8"))
 
+    # the step records are shared by summary.json and result.json; both encoders only read them
+    step_payloads = _profile_step_payloads(steps)
     if json_path is not None:
         json_payload = {
             "meta": {
-                "project_dir": str(config.project_dir),
+                "project_dir": project_dir_s,
                 "timestamp": timestamp,
                 "command": config.command,
                 "profile": profile,
                 "log_path": str(log_path),
                 "summary_path": str(summary_path),
             },
-            "steps": [
-                {
-                    "name": step.name,
-                    "status": step.status,
-                    "cmd": step.cmd,
-                    "exit_code": step.exit_code,
-                    "duration_s": step.duration_s,
-                }
-                for step in steps
-            ],
+            "steps": step_payloads,
             "overall_exit_code": 0 if status in ("SUCCESS", "SKIP") else 1,
             "failure_summary": failure_summary,
         }
-        json_path.write_text(json.dumps(json_payload, indent=2), encoding="utf-8")
+        encode = dumps_indented if config.json_summary_indent else dumps_compact
+        _write_file_bytes(json_path, encode(json_payload))
 
     _write_run_result_files(
         config.project_dir,
@@ -1117,27 +1603,12 @@ def write_profile_log_and_summary(
         failure_summary,
         [],
         reason,
+        step_payloads,
     )
 
-    backend = BackendResult(
-        status="SKIPPED",
-        cmd=None,
-        cwd=None,
-        exit_code=None,
-        duration_s=None,
-        output="",
-        summary_lines=[],
-        reason="profile run",
-    )
-    frontend = FrontendResult(
-        status="SKIPPED",
-        node_detected=False,
-        npm_detected=False,
-        install_attempted=False,
-        steps=[],
-        summary_lines=[],
-        reason="profile run",
-    )
+    backend = _SKIPPED_BACKEND_PROFILE
+    frontend = _SKIPPED_FRONTEND_PROFILE
+    finish_log()
     result = RunResult(
         backend=backend,
         frontend=frontend,
@@ -1149,9 +1620,9 @@ def write_profile_log_and_summary(
         profile=profile,
         profile_steps=list(steps),
     )
-    if result.overall_exit_code != 0:
+    if result.overall_exit_code != 0 and config.emit_failure_prompt:
         try:
-            write_failure_prompt(config, result)
+            write_failure_prompt(config, result, summary_lines=failure_section)
         except Exception:
             pass
     return result
@@ -1185,20 +1656,25 @@ def _legacy_steps_from_results(
         )
 
     if frontend.steps:
+        lint_warning = frontend.status == "WARNING"
         for step in frontend.steps:
-            step_status = "OK" if step.exit_code == 0 else "FAIL"
-            if frontend.status == "WARNING" and step.name == "lint" and step.exit_code == 0:
+            if step.exit_code != 0:
+                step_status = "FAIL"
+            elif lint_warning and step.name == "lint":
                 step_status = "WARNING"
+            else:
+                step_status = "OK"
+            # positional: name, status, cmd, exit_code, duration_s, stdout, stderr, timed_out
             steps.append(
                 ProfileStepResult(
-                    name=f"frontend-{step.name}",
-                    status=step_status,
-                    cmd=_format_cmd(step.cmd),
-                    exit_code=step.exit_code,
-                    duration_s=step.duration_s,
-                    stdout=step.stdout,
-                    stderr=step.stderr,
-                    timed_out=step.timed_out,
+                    "frontend-" + step.name,
+                    step_status,
+                    step.cmd_str,
+                    step.exit_code,
+                    step.duration_s,
+                    step.stdout,
+                    step.stderr,
+                    step.timed_out,
                 )
             )
     else:
@@ -1225,123 +1701,155 @@ def _legacy_overall_status_reason(
 
 
 def compute_run_status(result: RunResult) -> tuple[str, Optional[str]]:
-    if result.profile and result.profile != "legacy" and result.profile_steps is not None:
-        return _profile_overall_status_reason(result.profile_steps)
+    profile_steps = result.profile_steps
+    if profile_steps is not None and result.profile and result.profile != "legacy":
+        return _profile_overall_status_reason(profile_steps)
     return _legacy_overall_status_reason(result.backend, result.frontend)
 
 
+_LEGACY_SUMMARY_HEAD = """\
+1) Run meta:
+- project_dir: {project_dir}
+- timestamp: {timestamp}
+- command: {command}
+2) Backend:
+- status: {backend_status}
+- cmd: {backend_cmd}
+- cwd: {backend_cwd}
+- exit_code: {backend_exit_code}
+- duration_s: {backend_duration_s}
+3) Frontend:
+- status: {frontend_status}
+- node_detected: {node_detected}
+- npm_detected: {npm_detected}
+- install_attempted: {install_attempted}"""
+
+
 def write_log_and_summary(config: RunConfig, backend: BackendResult, frontend: FrontendResult) -> RunResult:
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+    if not config.write_logs:
+        return RunResult(
+            backend=backend,
+            frontend=frontend,
+            overall_exit_code=_compute_exit_code(config, backend, frontend),
+            log_path=None,
+            summary_path=None,
+            json_summary_path=None,
+            timestamp=timestamp,
+            profile="legacy",
+            profile_steps=_legacy_steps_from_results(backend, frontend),
+        )
     config.log_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = config.log_dir / f"run_{timestamp}.log"
     summary_path = config.log_dir / f"run_{timestamp}.summary.txt"
     json_path = config.log_dir / f"run_{timestamp}.summary.json" if config.json_summary else None
+    project_dir_s = str(config.project_dir)
 
-    log_lines: list[str] = []
-    log_lines.append("== Run Log ==")
-    log_lines.append(f"timestamp: {timestamp}")
-    log_lines.append(f"project_dir: {config.project_dir}")
-    log_lines.append("")
-
-    log_lines.append("== Backend ==")
+    # sections are added as list literals: one extend per block instead of an append per line
+    log_lines = ["== Run Log ==", f"timestamp: {timestamp}", f"project_dir: {project_dir_s}", "", "== Backend =="]
     if backend.status == "SKIPPED":
         log_lines.append(f"status: {backend.status}")
         if backend.reason:
             log_lines.append(f"reason: {backend.reason}")
     else:
-        log_lines.append(f"status: {backend.status}")
-        log_lines.append(f"cmd: {backend.cmd}")
-        log_lines.append(f"cwd: {backend.cwd}")
-        log_lines.append(f"exit_code: {backend.exit_code}")
-        log_lines.append(f"duration_s: {backend.duration_s:.2f}")
-        log_lines.append("STDOUT/STDERR:")
-        log_lines.append(backend.output)
-    log_lines.append("")
-
-    log_lines.append("== Frontend ==")
-    log_lines.append(f"status: {frontend.status}")
-    log_lines.append(f"node_detected: {frontend.node_detected}")
-    log_lines.append(f"npm_detected: {frontend.npm_detected}")
-    log_lines.append(f"install_attempted: {frontend.install_attempted}")
+        log_lines += [
+            f"status: {backend.status}",
+            f"cmd: {backend.cmd}",
+            f"cwd: {backend.cwd}",
+            f"exit_code: {backend.exit_code}",
+            f"duration_s: {backend.duration_s:.2f}",
+            "STDOUT/STDERR:",
+            backend.output,
+        ]
+    log_lines += [
+        "",
+        "== Frontend ==",
+        f"status: {frontend.status}",
+        f"node_detected: {frontend.node_detected}",
+        f"npm_detected: {frontend.npm_detected}",
+        f"install_attempted: {frontend.install_attempted}",
+    ]
     if frontend.reason:
         log_lines.append(f"reason: {frontend.reason}")
     for step in frontend.steps:
-        log_lines.append(f"-- step: {step.name}")
-        log_lines.append(f"cmd: {_format_cmd(step.cmd)}")
-        log_lines.append(f"exit_code: {step.exit_code}")
-        log_lines.append(f"duration_s: {step.duration_s:.2f}")
-        log_lines.append("STDOUT:")
-        log_lines.append(step.stdout)
-        log_lines.append("STDERR:")
-        log_lines.append(step.stderr)
+        log_lines += [
+            f"-- step: {step.name}",
+            f"cmd: {step.cmd_str}",
+            f"exit_code: {step.exit_code}",
+            f"duration_s: {step.duration_s:.2f}",
+            "STDOUT:",
+            step.stdout,
+            "STDERR:",
+            step.stderr,
+        ]
     log_lines.append("")
 
-    log_path.write_text("\n".join(log_lines).strip() + "\n", encoding="utf-8")
+    finish_log = _start_log_write(log_path, log_lines)
+    outputs: list[tuple[Path, bytes]] = []
 
     overall_exit_code = _compute_exit_code(config, backend, frontend)
 
-    summary_lines: list[str] = []
-    summary_lines.append("1) Run meta:")
-    summary_lines.append(f"- project_dir: {config.project_dir}")
-    summary_lines.append(f"- timestamp: {timestamp}")
-    summary_lines.append(f"- command: {config.command}")
-
-    summary_lines.append("2) Backend:")
-    summary_lines.append(f"- status: {_status_line(backend.status, backend.reason)}")
-    summary_lines.append(f"- cmd: {backend.cmd or 'N/A'}")
-    summary_lines.append(f"- cwd: {backend.cwd or 'N/A'}")
-    summary_lines.append(f"- exit_code: {backend.exit_code if backend.exit_code is not None else 'N/A'}")
-    summary_lines.append(f"- duration_s: {backend.duration_s if backend.duration_s is not None else 'N/A'}")
-
-    summary_lines.append("3) Frontend:")
-    summary_lines.append(f"- status: {_status_line(frontend.status, frontend.reason)}")
-    summary_lines.append(f"- node_detected: {frontend.node_detected}")
-    summary_lines.append(f"- npm_detected: {frontend.npm_detected}")
-    summary_lines.append(f"- install_attempted: {frontend.install_attempted}")
+    failure_section: list[str] = []
+    # the fixed-shape head is one rendered block; joining it with the variable sections below
+    # yields the same text as one entry per line
+    summary_lines = [
+        _LEGACY_SUMMARY_HEAD.format(
+            project_dir=project_dir_s,
+            timestamp=timestamp,
+            command=config.command,
+            backend_status=_status_line(backend.status, backend.reason),
+            backend_cmd=backend.cmd or "N/A",
+            backend_cwd=backend.cwd or "N/A",
+            backend_exit_code=backend.exit_code if backend.exit_code is not None else "N/A",
+            backend_duration_s=backend.duration_s if backend.duration_s is not None else "N/A",
+            frontend_status=_status_line(frontend.status, frontend.reason),
+            node_detected=frontend.node_detected,
+            npm_detected=frontend.npm_detected,
+            install_attempted=frontend.install_attempted,
+        )
+    ]
     if frontend.steps:
-        for step in frontend.steps:
-            summary_lines.append(
-                f"- step: {step.name} exit_code={step.exit_code} duration_s={step.duration_s:.2f}"
-            )
+        summary_lines.extend(
+            f"- step: {step.name} exit_code={step.exit_code} duration_s={step.duration_s:.2f}"
+            for step in frontend.steps
+        )
     else:
         summary_lines.append("- steps: none")
 
-    has_frontend_warning = frontend.status == "WARNING"
-    if backend.status == "FAIL" or frontend.status == "FAIL":
-        summary_lines.append("4) Failure summary:")
-        if backend.status == "FAIL":
-            for line in backend.summary_lines:
-                summary_lines.append(f"- Backend: {line}")
-        if frontend.status == "FAIL":
-            for line in frontend.summary_lines:
-                summary_lines.append(f"- Frontend: {line}")
-
-        summary_lines.append("5) Next actions:")
+    backend_failed = backend.status == "FAIL"
+    frontend_failed = frontend.status == "FAIL"
+    # raw failing lines, reused for result.json/result.txt below
+    failure_summary: list[str] = []
+    if backend_failed or frontend_failed:
+        # one pass per failing side fills the failure section and the next actions together
         actions: list[str] = []
-        if backend.status == "FAIL":
+        if backend_failed:
             for line in backend.summary_lines:
-                actions.append(f"pytest failed: {line}")
-        if frontend.status == "FAIL":
+                failure_section.append(f"- Backend: {line}")
+                actions.append(f"- pytest failed: {line}")
+            failure_summary.extend(backend.summary_lines)
+        if frontend_failed:
             for line in frontend.summary_lines:
-                actions.append(f"frontend failed: {line}")
-        if not actions:
-            actions.append("Check log output for failing command.")
-        for line in actions[:5]:
-            summary_lines.append(f"- {line}")
-    elif has_frontend_warning and frontend.summary_lines:
+                failure_section.append(f"- Frontend: {line}")
+                actions.append(f"- frontend failed: {line}")
+            failure_summary.extend(frontend.summary_lines)
+        summary_lines.append("4) Failure summary:")
+        summary_lines.extend(failure_section)
+        summary_lines.append("5) Next actions:")
+        summary_lines.extend(actions[:5] or ["- Check log output for failing command."])
+    elif frontend.status == "WARNING" and frontend.summary_lines:
         summary_lines.append("4) Warning summary:")
-        for line in frontend.summary_lines:
-            summary_lines.append(f"- Frontend warning: {line}")
+        summary_lines.extend(f"- Frontend warning: {line}" for line in frontend.summary_lines)
         summary_lines.append("5) Next actions:")
         summary_lines.append("- Review lint warnings; avoid unnecessary fix loop when warnings are non-blocking.")
 
-    summary_path.write_text("\n".join(summary_lines).strip() + "\n", encoding="utf-8")
+    outputs.append((summary_path, ("\n".join(summary_lines).strip() + "\n").encode("utf-8")))
 
     if json_path is not None:
         json_payload = {
             "meta": {
-                "project_dir": str(config.project_dir),
+                "project_dir": project_dir_s,
                 "timestamp": timestamp,
                 "command": config.command,
                 "log_path": str(log_path),
@@ -1360,30 +1868,20 @@ def write_log_and_summary(config: RunConfig, backend: BackendResult, frontend: F
                 "node_detected": frontend.node_detected,
                 "npm_detected": frontend.npm_detected,
                 "install_attempted": frontend.install_attempted,
-                "steps": [
-                    {
-                        "name": step.name,
-                        "cmd": step.cmd,
-                        "exit_code": step.exit_code,
-                        "duration_s": step.duration_s,
-                        "summary_lines": step.summary_lines,
-                    }
-                    for step in frontend.steps
-                ],
+                "steps": [dict(zip(_FRONTEND_STEP_KEYS, _frontend_step_fields(step))) for step in frontend.steps],
                 "reason": frontend.reason,
                 "summary_lines": frontend.summary_lines,
             },
             "overall_exit_code": overall_exit_code,
         }
-        json_path.write_text(json.dumps(json_payload, indent=2), encoding="utf-8")
+        encode = dumps_indented if config.json_summary_indent else dumps_compact
+        outputs.append((json_path, encode(json_payload)))
+
+    for path, data in outputs:
+        _write_file_bytes(path, data)
 
     legacy_steps = _legacy_steps_from_results(backend, frontend)
     status, reason = _legacy_overall_status_reason(backend, frontend)
-    failure_summary: list[str] = []
-    if backend.status == "FAIL":
-        failure_summary.extend(backend.summary_lines)
-    if frontend.status == "FAIL":
-        failure_summary.extend(frontend.summary_lines)
     _write_run_result_files(
         config.project_dir,
         status,
@@ -1395,6 +1893,10 @@ def write_log_and_summary(config: RunConfig, backend: BackendResult, frontend: F
         reason,
     )
 
+    finish_log()
+    if frontend.output_log is not None:
+        _fold_live_log(log_path, frontend.output_log)
+        frontend.output_log = log_path
     result = RunResult(
         backend=backend,
         frontend=frontend,
@@ -1406,52 +1908,33 @@ def write_log_and_summary(config: RunConfig, backend: BackendResult, frontend: F
         profile="legacy",
         profile_steps=legacy_steps,
     )
-    if overall_exit_code != 0:
+    if overall_exit_code != 0 and config.emit_failure_prompt:
         try:
-            write_failure_prompt(config, result)
+            write_failure_prompt(config, result, summary_lines=failure_section)
         except Exception:
             pass
     return result
 
 
+_PROFILE_RUNNERS: dict[str, Callable[[RunConfig], list[ProfileStepResult]]] = {
+    "python-pytest": run_python_pytest_profile,
+    "node-vite": run_node_vite_profile,
+    "generic-shell": run_generic_shell_profile,
+}
+
+
 def run_pipeline(config: RunConfig) -> RunResult:
     profile = _normalize_profile_name(config.profile)
     if profile:
-        if profile == "python-pytest":
-            steps = run_python_pytest_profile(config)
-        elif profile == "node-vite":
-            steps = run_node_vite_profile(config)
-        elif profile == "generic-shell":
-            steps = run_generic_shell_profile(config)
+        profile_runner = _PROFILE_RUNNERS.get(profile)
+        if profile_runner is not None:
+            steps = profile_runner(config)
         else:
-            steps = [
-                _profile_step_skip(
-                    "profile",
-                    None,
-                    f"Unknown profile: {profile}",
-                )
-            ]
+            steps = [_profile_step_skip("profile", None, f"Unknown profile: {profile}")]
         return write_profile_log_and_summary(config, profile, steps)
 
-    backend = BackendResult(
-        status="SKIPPED",
-        cmd=None,
-        cwd=None,
-        exit_code=None,
-        duration_s=None,
-        output="",
-        summary_lines=[],
-        reason="backend not requested.",
-    )
-    frontend = FrontendResult(
-        status="SKIPPED",
-        node_detected=False,
-        npm_detected=False,
-        install_attempted=False,
-        steps=[],
-        summary_lines=[],
-        reason="frontend not requested.",
-    )
+    backend = _SKIPPED_BACKEND_DEFAULT
+    frontend = _SKIPPED_FRONTEND_DEFAULT
 
     if config.backend_only:
         run_backend = True
@@ -1467,9 +1950,20 @@ def run_pipeline(config: RunConfig) -> RunResult:
         run_backend = True
         run_frontend = False
 
-    if run_backend:
+    if run_backend and run_frontend:
+        # independent subprocess pipelines with separate cwds; run them side by side
+        from concurrent.futures import ThreadPoolExecutor
+
+        if config.write_logs:
+            config.log_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            backend_future = executor.submit(run_backend_pytest, config)
+            frontend_future = executor.submit(run_frontend_pipeline, config)
+            backend = backend_future.result()
+            frontend = frontend_future.result()
+    elif run_backend:
         backend = run_backend_pytest(config)
-    if run_frontend:
+    elif run_frontend:
         frontend = run_frontend_pipeline(config)
 
     return write_log_and_summary(config, backend, frontend)
@@ -1477,9 +1971,10 @@ def run_pipeline(config: RunConfig) -> RunResult:
 
 def print_run_result(result: RunResult) -> None:
     status, _ = compute_run_status(result)
+    log_note = f" Log: {result.log_path}" if result.log_path is not None else ""
     if status == "FAIL":
-        print(f"[ERROR] Run failed. Log: {result.log_path}", file=sys.stderr)
+        print(f"[ERROR] Run failed.{log_note}", file=sys.stderr)
     elif status == "SKIP":
-        print(f"[SKIP] Run skipped. Log: {result.log_path}")
+        print(f"[SKIP] Run skipped.{log_note}")
     else:
-        print(f"[OK] Run completed. Log: {result.log_path}")
+        print(f"[OK] Run completed.{log_note}")
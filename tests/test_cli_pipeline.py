@@ -1806,3 +1806,111 @@ def test_pipeline_auto_deploy_skipped_only_does_not_make_not_done(monkeypatch, t
     result_payload = json.loads((tmp_path / ".archmind" / "result.json").read_text(encoding="utf-8"))
     assert result_payload.get("auto_deploy_status") == "SKIPPED"
     assert result_payload.get("final_status") == "DONE"
+
+
+def test_pipeline_generator_call_strategy_follows_signature() -> None:
+    from archmind.pipeline import _call_generator_entry, _generator_call_strategy
+
+    def idea_opt(idea, opt):  # type: ignore[no-untyped-def]
+        return ("idea_opt", idea, opt)
+
+    def idea_only(idea):  # type: ignore[no-untyped-def]
+        return ("idea", idea)
+
+    def no_args():  # type: ignore[no-untyped-def]
+        return ("none",)
+
+    def keyword_only(*, idea, options):  # type: ignore[no-untyped-def]
+        return ("kwargs", idea, options)
+
+    def raises_type_error(idea, opt):  # type: ignore[no-untyped-def]
+        raise TypeError("real generator bug")
+
+    assert _generator_call_strategy(idea_opt) == "idea_opt"
+    assert _generator_call_strategy(idea_only) == "idea"
+    assert _generator_call_strategy(no_args) == "none"
+    assert _generator_call_strategy(keyword_only) == "kwargs"
+    assert _call_generator_entry(idea_opt, "x", "o") == ("idea_opt", "x", "o")
+    assert _call_generator_entry(idea_only, "x", "o") == ("idea", "x")
+    assert _call_generator_entry(no_args, "x", "o") == ("none",)
+    assert _call_generator_entry(keyword_only, "x", "o") == ("kwargs", "x", "o")
+    with pytest.raises(TypeError, match="real generator bug"):
+        _call_generator_entry(raises_type_error, "x", "o")
+
+
+def test_pipeline_build_command_is_shell_safe() -> None:
+    import shlex
+
+    from archmind.pipeline import PipelineOptions, _build_command
+
+    opts = PipelineOptions(
+        idea="simple todo app",
+        path=None,
+        out="generated",
+        name="demo",
+        template="fastapi",
+        starter_profile="",
+        template_explicit=False,
+        prompt=None,
+        gen_model="llama3:latest",
+        gen_ollama_base_url="http://localhost:11434",
+        gen_max_retries=2,
+        gen_timeout_s=240,
+        run_all=False,
+        backend_only=True,
+        frontend_only=False,
+        no_install=True,
+        profile="generic-shell",
+        cmds=["pytest -q", "ruff check ."],
+        timeout_s=60,
+        scope="backend",
+        max_iterations=1,
+        model="none",
+        apply=False,
+        dry_run=False,
+        json_summary=True,
+        auto_deploy=False,
+        auto_deploy_target="",
+    )
+
+    assert opts.cmds == ("pytest -q", "ruff check .")
+    with pytest.raises(AttributeError):
+        opts.template = "nextjs"  # type: ignore[misc]
+    assert _build_command(opts) == _build_command(opts)
+    assert shlex.split(_build_command(opts)) == [
+        "archmind",
+        "pipeline",
+        "--idea",
+        "simple todo app",
+        "--out",
+        "generated",
+        "--name",
+        "demo",
+        "--template",
+        "fastapi",
+        "--gen-model",
+        "llama3:latest",
+        "--gen-ollama-base-url",
+        "http://localhost:11434",
+        "--gen-max-retries",
+        "2",
+        "--gen-timeout-s",
+        "240",
+        "--backend-only",
+        "--profile",
+        "generic-shell",
+        "--cmd",
+        "pytest -q",
+        "--cmd",
+        "ruff check .",
+        "--no-install",
+        "--timeout-s",
+        "60",
+        "--scope",
+        "backend",
+        "--max-iterations",
+        "1",
+        "--model",
+        "none",
+        "--json-summary",
+    ]
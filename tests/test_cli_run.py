@@ -71,6 +71,22 @@ def _find_prompt(root: Path) -> Path:
     return prompts[-1]
 
 
+def _make_config(tmp_path: Path, **overrides: object) -> RunConfig:
+    values: dict[str, object] = {
+        "project_dir": tmp_path,
+        "run_all": False,
+        "backend_only": False,
+        "frontend_only": False,
+        "no_install": True,
+        "timeout_s": 30,
+        "log_dir": tmp_path / ".archmind" / "run_logs",
+        "json_summary": False,
+        "command": "run",
+    }
+    values.update(overrides)
+    return RunConfig(**values)  # type: ignore[arg-type]
+
+
 def test_run_missing_path_returns_64(capsys, tmp_path: Path) -> None:
     missing = tmp_path / "missing_project"
     exit_code = main(["run", "--path", str(missing)])
@@ -113,7 +129,7 @@ def test_backend_uses_project_venv_python(tmp_path: Path, monkeypatch) -> None:
 
     captured: dict[str, list[str]] = {}
 
-    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
         captured["cmd"] = cmd
         return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="", stderr="")
 
@@ -140,17 +156,7 @@ def test_frontend_absent_keeps_backend_result(tmp_path: Path) -> None:
 
 
 def test_frontend_absent_reason_mentions_root_nextjs_detection(tmp_path: Path) -> None:
-    config = RunConfig(
-        project_dir=tmp_path,
-        run_all=True,
-        backend_only=False,
-        frontend_only=False,
-        no_install=False,
-        timeout_s=30,
-        log_dir=tmp_path / ".archmind" / "run_logs",
-        json_summary=False,
-        command="run",
-    )
+    config = _make_config(tmp_path, run_all=True, no_install=False)
 
     result = run_frontend_pipeline(config)
     assert result.status == "ABSENT"
@@ -176,7 +182,7 @@ def test_frontend_subdir_package_uses_frontend_workdir(tmp_path: Path, monkeypat
 
     npm_cwds: list[Path] = []
 
-    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
         if cmd and cmd[0] == "npm":
             npm_cwds.append(cwd)
             if cmd[:2] == ["npm", "ci"]:
@@ -199,7 +205,7 @@ def test_frontend_root_nextjs_uses_project_workdir(tmp_path: Path, monkeypatch)
 
     npm_cwds: list[Path] = []
 
-    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
         if cmd and cmd[0] == "npm":
             npm_cwds.append(cwd)
             if cmd[:2] == ["npm", "ci"]:
@@ -224,7 +230,7 @@ def test_frontend_fail_sets_exit_2(tmp_path: Path, monkeypatch) -> None:
 
     calls: list[str] = []
 
-    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
         calls.append(" ".join(cmd))
         if "pytest" in cmd:
             return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="", stderr="")
@@ -252,7 +258,7 @@ def test_frontend_clean_lint_message_is_success_and_not_failure_summary(tmp_path
     _write_frontend_package(tmp_path)
     monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
 
-    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
         if cmd[:2] == ["npm", "ci"]:
             return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="ci ok", stderr="")
         if cmd[:3] == ["npm", "run", "lint"]:
@@ -294,7 +300,7 @@ def test_frontend_lint_warning_only_is_not_fail(tmp_path: Path, monkeypatch) ->
 
     monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
 
-    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
         if "pytest" in cmd:
             return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="", stderr="")
         if cmd[:2] == ["npm", "ci"]:
@@ -331,7 +337,7 @@ def test_frontend_lint_error_text_fails_even_when_exit_zero(tmp_path: Path, monk
 
     monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
 
-    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int) -> CommandResult:
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
         if "pytest" in cmd:
             return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="", stderr="")
         if cmd[:2] == ["npm", "ci"]:
@@ -349,3 +355,639 @@ def test_frontend_lint_error_text_fails_even_when_exit_zero(tmp_path: Path, monk
     summary_text = _find_summary(tmp_path).read_text(encoding="utf-8")
     assert "Failure summary:" in summary_text
     assert "Frontend: ESLint: Parsing error" in summary_text
+
+
+def test_run_cmd_capture_streams_output_to_log_and_keeps_tail(tmp_path: Path) -> None:
+    import sys
+
+    from archmind.runner import run_cmd_capture
+
+    script = "import sys\nfor i in range(500):\n    print(f'line {i}')\nprint('boom', file=sys.stderr)\nsys.exit(3)\n"
+    log_path = tmp_path / "logs" / "live.log"
+
+    result = run_cmd_capture([sys.executable, "-c", script], tmp_path, 30, log_path=log_path, tail_lines=5)
+
+    assert result.exit_code == 3
+    assert result.timed_out is False
+    assert result.stdout.splitlines() == [f"line {i}" for i in range(495, 500)]
+    assert result.stderr.strip() == "boom"
+    assert result.log_path == log_path
+    live = log_path.read_text(encoding="utf-8")
+    assert "line 0" in live and "line 499" in live and "boom" in live
+
+
+def test_run_cmd_capture_times_out_with_partial_output(tmp_path: Path) -> None:
+    import sys
+
+    from archmind.runner import run_cmd_capture
+
+    script = "import time\nprint('started', flush=True)\ntime.sleep(30)\n"
+
+    result = run_cmd_capture([sys.executable, "-c", script], tmp_path, 1)
+
+    assert result.timed_out is True
+    assert result.exit_code == 124
+    assert "started" in result.stdout
+    assert result.duration_s < 10
+
+
+def test_run_all_runs_backend_and_frontend_concurrently(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    from archmind.runner import BackendResult, FrontendResult, run_pipeline
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_backend(config: RunConfig) -> BackendResult:
+        barrier.wait()
+        return BackendResult(
+            status="PASS", cmd="pytest", cwd=str(tmp_path), exit_code=0, duration_s=0.1, output="", summary_lines=[]
+        )
+
+    def fake_frontend(config: RunConfig) -> FrontendResult:
+        barrier.wait()
+        return FrontendResult(
+            status="PASS",
+            node_detected=True,
+            npm_detected=True,
+            install_attempted=False,
+            steps=[],
+            summary_lines=[],
+        )
+
+    monkeypatch.setattr("archmind.runner.run_backend_pytest", fake_backend)
+    monkeypatch.setattr("archmind.runner.run_frontend_pipeline", fake_frontend)
+    config = _make_config(tmp_path, run_all=True)
+
+    result = run_pipeline(config)
+
+    assert result.backend.status == "PASS"
+    assert result.frontend.status == "PASS"
+    assert result.overall_exit_code == 0
+
+
+def test_extract_failure_details_reads_first_failed_test() -> None:
+    from archmind.runner import _extract_failure_details
+
+    output = (
+        "Traceback (most recent call last):\n"
+        '  File "app/service.py", line 3, in run\n'
+        "ValueError: bad\n"
+        "FAILED tests/test_api.py::test_create[a b] - ValueError: bad\n"
+        "ERROR tests/test_db.py::test_conn\n"
+    )
+
+    details = _extract_failure_details(output)
+
+    assert details["test_name"] == "tests/test_api.py::test_create[a b]"
+    assert details["file_path"] == "tests/test_api.py"
+    assert details["stack_top"][0].startswith("Traceback")
+    assert _extract_failure_details('  File "app/x.py", line 1\n')["file_path"] == "app/x.py"
+
+
+def test_extract_tail_lines_matches_splitlines_tail() -> None:
+    from archmind.runner import _extract_tail_lines
+
+    text = "\n".join(f"line {i}" for i in range(1000)) + "\n"
+
+    assert _extract_tail_lines(text, max_lines=3) == ["line 997", "line 998", "line 999"]
+    assert _extract_tail_lines("a\r\nb\rc", max_lines=2) == ["b", "c"]
+    assert _extract_tail_lines("only\n", max_lines=5) == ["only"]
+    assert _extract_tail_lines("", max_lines=5) == []
+
+
+def test_json_summary_can_be_written_compact(tmp_path: Path) -> None:
+    from archmind.runner import BackendResult, FrontendResult, write_log_and_summary
+
+    config = _make_config(tmp_path, backend_only=True, json_summary=True, json_summary_indent=False)
+    backend = BackendResult(
+        status="PASS", cmd="pytest", cwd=str(tmp_path), exit_code=0, duration_s=0.1, output="ok", summary_lines=[]
+    )
+    frontend = FrontendResult(
+        status="SKIPPED",
+        node_detected=False,
+        npm_detected=False,
+        install_attempted=False,
+        steps=[],
+        summary_lines=[],
+        reason="frontend not requested.",
+    )
+
+    result = write_log_and_summary(config, backend, frontend)
+
+    assert result.json_summary_path is not None
+    raw = result.json_summary_path.read_text(encoding="utf-8")
+    assert "\n" not in raw
+    assert json.loads(raw)["backend"]["status"] == "PASS"
+
+
+def test_detect_node_npm_caches_lookups_per_path(monkeypatch) -> None:
+    from archmind.runner import _detect_node_npm
+
+    calls: list[str] = []
+
+    def fake_which(name: str):
+        calls.append(name)
+        return "/usr/bin/" + name
+
+    monkeypatch.setattr("archmind.runner.shutil.which", fake_which)
+    monkeypatch.setenv("PATH", "/opt/a")
+
+    assert _detect_node_npm() == (True, True)
+    assert _detect_node_npm() == (True, True)
+    assert calls == ["node", "npm"]
+
+    monkeypatch.setenv("PATH", "/opt/b")
+    _detect_node_npm()
+    assert calls == ["node", "npm", "node", "npm"]
+
+
+def test_command_results_carry_shell_quoted_cmd_str(tmp_path: Path) -> None:
+    from archmind.runner import FrontendStepResult
+
+    result = CommandResult(
+        cmd=["/opt/my env/python", "-m", "pytest"], cwd=tmp_path, exit_code=0, duration_s=0.0, stdout="", stderr=""
+    )
+    step = FrontendStepResult(
+        name="lint", cmd=["npm", "run", "lint"], exit_code=0, duration_s=0.0, stdout="", stderr="", summary_lines=[]
+    )
+
+    assert result.cmd_str == "'/opt/my env/python' -m pytest"
+    assert step.cmd_str == "npm run lint"
+
+
+def test_failure_prompt_uses_in_memory_summary_lines(tmp_path: Path, monkeypatch) -> None:
+    from archmind.runner import BackendResult, FrontendResult, write_log_and_summary
+
+    def fail_reread(*_args):
+        raise AssertionError("summary files should not be re-read")
+
+    monkeypatch.setattr("archmind.runner._extract_failure_summary_lines", fail_reread)
+
+    config = _make_config(tmp_path, backend_only=True, command="archmind run --path demo")
+    backend = BackendResult(
+        status="FAIL",
+        cmd="pytest",
+        cwd=str(tmp_path),
+        exit_code=1,
+        duration_s=0.1,
+        output="FAILED tests/test_a.py::test_x - AssertionError",
+        summary_lines=["FAILED tests/test_a.py::test_x - AssertionError"],
+    )
+    frontend = FrontendResult(
+        status="SKIPPED",
+        node_detected=False,
+        npm_detected=False,
+        install_attempted=False,
+        steps=[],
+        summary_lines=[],
+        reason="frontend not requested.",
+    )
+
+    write_log_and_summary(config, backend, frontend)
+
+    prompt_text = _find_prompt(tmp_path).read_text(encoding="utf-8")
+    assert "- - Backend: FAILED tests/test_a.py::test_x - AssertionError" in prompt_text
+    assert "- 실패한 테스트: tests/test_a.py::test_x" in prompt_text
+
+
+def test_read_package_scripts_normalizes_non_string_values(tmp_path: Path) -> None:
+    from archmind.runner import _read_package_scripts
+
+    package_json = tmp_path / "package.json"
+    package_json.write_text('{"scripts": {"lint": "eslint .", "build": 1}}', encoding="utf-8")
+    assert _read_package_scripts(package_json) == {"lint": "eslint .", "build": "1"}
+
+    package_json.write_text('{"scripts": {"lint": "eslint ."}}', encoding="utf-8")
+    assert _read_package_scripts(package_json) == {"lint": "eslint ."}
+
+    package_json.write_text('{"scripts": ["lint"]}', encoding="utf-8")
+    assert _read_package_scripts(package_json) == {}
+
+
+def test_frontend_steps_tee_output_to_live_log(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from archmind.runner import BackendResult, write_log_and_summary
+
+    _write_frontend_package(tmp_path)
+    monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
+    tails: dict[str, object] = {}
+
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **kwargs) -> CommandResult:
+        tails[" ".join(cmd)] = kwargs.get("tail_lines")
+        if kwargs.get("log_fd") is not None:
+            os.write(kwargs["log_fd"], f"out of {cmd[-1]}\n".encode("utf-8"))
+        return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="ok", stderr="")
+
+    monkeypatch.setattr("archmind.runner.run_cmd_capture", fake_run_cmd_capture)
+    config = _make_config(tmp_path, frontend_only=True, no_install=False)
+
+    result = run_frontend_pipeline(config)
+    second = run_frontend_pipeline(config)
+
+    # every run tees into its own scratch file, even when two start within the same second
+    assert result.output_log is not None and second.output_log is not None
+    assert result.output_log != second.output_log
+    live = result.output_log.read_text(encoding="utf-8")
+    assert "== install: npm ci ==\nout of ci\n" in live
+    assert "== lint: npm run lint ==\nok\n" in live
+    assert second.output_log.read_text(encoding="utf-8") == live
+    assert tails["npm ci"] == 200
+    assert tails["npm run lint"] is None
+
+    # writing the run log folds the live output in and removes the scratch file
+    live_path = result.output_log
+    backend = BackendResult(
+        status="SKIPPED", cmd=None, cwd=None, exit_code=None, duration_s=None, output="", summary_lines=[]
+    )
+    run_result = write_log_and_summary(config, backend, result)
+    assert not live_path.exists()
+    assert run_result.frontend.output_log == run_result.log_path
+    log_text = run_result.log_path.read_text(encoding="utf-8")
+    assert "== Frontend output ==\n== install: npm ci ==\nout of ci\n" in log_text
+
+
+def test_frontend_check_scripts_run_concurrently_before_build(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    _write_frontend_package(tmp_path)
+    monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
+    barrier = threading.Barrier(2, timeout=5)
+    calls: list[str] = []
+
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
+        if cmd[:3] in (["npm", "run", "lint"], ["npm", "run", "test"]):
+            barrier.wait()
+        calls.append(" ".join(cmd))
+        exit_code = 1 if cmd[:3] == ["npm", "run", "test"] else 0
+        return CommandResult(cmd=cmd, cwd=cwd, exit_code=exit_code, duration_s=0.01, stdout="out", stderr="")
+
+    monkeypatch.setattr("archmind.runner.run_cmd_capture", fake_run_cmd_capture)
+    config = _make_config(tmp_path, frontend_only=True)
+
+    result = run_frontend_pipeline(config)
+
+    assert result.status == "FAIL"
+    assert result.reason == "test failed."
+    assert [step.name for step in result.steps] == ["lint", "test"]
+    assert "npm run build" not in calls
+
+
+def test_frontend_lint_failure_cancels_running_checks(tmp_path: Path, monkeypatch) -> None:
+    import threading
+    import time
+
+    _write_frontend_package(tmp_path)
+    monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
+    calls: list[str] = []
+    cancelled: list[bool] = []
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **kwargs) -> CommandResult:
+        calls.append(" ".join(cmd))
+        both_started.wait()
+        if cmd[:3] == ["npm", "run", "lint"]:
+            return CommandResult(cmd=cmd, cwd=cwd, exit_code=1, duration_s=0.01, stdout="", stderr="error: bad")
+        cancelled.append(kwargs["cancel"].wait(timeout=10))
+        return CommandResult(cmd=cmd, cwd=cwd, exit_code=-15, duration_s=0.01, stdout="", stderr="")
+
+    monkeypatch.setattr("archmind.runner.run_cmd_capture", fake_run_cmd_capture)
+    config = _make_config(tmp_path, frontend_only=True)
+
+    started = time.monotonic()
+    result = run_frontend_pipeline(config)
+
+    assert time.monotonic() - started < 5
+    assert result.status == "FAIL"
+    assert [step.name for step in result.steps] == ["lint"]
+    assert cancelled == [True]
+    assert "npm run build" not in calls
+
+
+def test_run_shell_capture_stops_child_when_cancelled(tmp_path: Path) -> None:
+    import threading
+
+    from archmind.runner import run_shell_capture
+
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+
+    result = run_shell_capture("echo started; sleep 30", tmp_path, 60, cancel=cancel)
+
+    assert result.timed_out is False
+    assert result.exit_code != 0
+    assert "started" in result.stdout
+    assert result.duration_s < 10
+
+
+def test_backend_python_executable_is_resolved_once_per_config(tmp_path: Path, monkeypatch) -> None:
+    from archmind.runner import run_backend_pytest
+
+    _write_pytest_pass_project(tmp_path)
+    lookups: list[Path] = []
+    seen_cmds: list[list[str]] = []
+
+    def fake_select(project_dir: Path, *, has_venv: bool = True) -> str:
+        lookups.append(project_dir)
+        return "/opt/py/bin/python"
+
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
+        seen_cmds.append(cmd)
+        return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="", stderr="")
+
+    monkeypatch.setattr("archmind.runner._select_python_executable", fake_select)
+    monkeypatch.setattr("archmind.runner.run_cmd_capture", fake_run_cmd_capture)
+    config = _make_config(tmp_path, backend_only=True)
+
+    run_backend_pytest(config)
+    run_backend_pytest(config)
+
+    assert lookups == [tmp_path]
+    assert [cmd[0] for cmd in seen_cmds] == ["/opt/py/bin/python", "/opt/py/bin/python"]
+
+
+def test_run_shell_capture_streams_and_times_out(tmp_path: Path) -> None:
+    from archmind.runner import run_shell_capture
+
+    result = run_shell_capture("printf 'a\\nb\\nc\\n'; echo err >&2; exit 4", tmp_path, 30, tail_lines=2)
+    assert result.cmd == ["sh", "-c", "printf 'a\\nb\\nc\\n'; echo err >&2; exit 4"]
+    assert result.exit_code == 4
+    assert result.stdout.splitlines() == ["b", "c"]
+    assert result.stderr.strip() == "err"
+
+    slow = run_shell_capture("echo started; sleep 30", tmp_path, 1)
+    assert slow.timed_out is True
+    assert slow.exit_code == 124
+    assert "started" in slow.stdout
+    assert slow.duration_s < 10
+
+
+def test_run_shell_capture_times_out_after_child_closes_pipes(tmp_path: Path) -> None:
+    from archmind.runner import run_shell_capture
+
+    result = run_shell_capture("echo started; exec >/dev/null 2>&1; sleep 30", tmp_path, 1)
+    assert result.timed_out is True
+    assert result.exit_code == 124
+    assert "started" in result.stdout
+    assert result.duration_s < 10
+
+
+def test_read_package_scripts_reuses_parse_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from archmind import runner
+    from archmind.runner import _read_package_scripts
+
+    package_json = tmp_path / "package.json"
+    package_json.write_text('{"scripts": {"lint": "eslint ."}}', encoding="utf-8")
+    parses: list[bytes] = []
+    real_loads = runner.loads
+
+    def counting_loads(data):
+        parses.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr(runner, "loads", counting_loads)
+
+    first = _read_package_scripts(package_json)
+    first["mutated"] = "x"
+    assert _read_package_scripts(package_json) == {"lint": "eslint ."}
+    assert len(parses) == 1
+
+    package_json.write_text('{"scripts": {"lint": "eslint .", "test": "vitest"}}', encoding="utf-8")
+    stat = package_json.stat()
+    os.utime(package_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _read_package_scripts(package_json) == {"lint": "eslint .", "test": "vitest"}
+    assert len(parses) == 2
+
+
+def test_extract_failure_summary_lines_reads_section_or_tail(tmp_path: Path) -> None:
+    from archmind.runner import _extract_failure_summary_lines
+
+    summary = tmp_path / "run.summary.txt"
+    summary.write_text(
+        "1) Run meta:\n- project_dir: x\n4) Failure summary:\n- Backend: boom\n\n5) Next actions:\n- fix it\n",
+        encoding="utf-8",
+    )
+    assert _extract_failure_summary_lines(summary, None) == ["- Backend: boom"]
+
+    summary.write_text("\n".join(f"line {i}" for i in range(30)) + "\n", encoding="utf-8")
+    assert _extract_failure_summary_lines(summary, None) == [f"line {i}" for i in range(20, 30)]
+
+
+def test_extract_tail_key_lines_prefers_keyword_lines() -> None:
+    from archmind.runner import _extract_tail_key_lines
+
+    text = "collected 3 items\nE   AssertionError: boom\nplain\nFAILED tests/test_a.py::test_x\n1 failed\n"
+
+    assert _extract_tail_key_lines(text) == ["E   AssertionError: boom", "FAILED tests/test_a.py::test_x"]
+    assert _extract_tail_key_lines(text, key_max=1) == ["FAILED tests/test_a.py::test_x"]
+    assert _extract_tail_key_lines(text, tail_max=1) == ["1 failed"]
+    assert _extract_tail_key_lines("a\nb\nc\nd", key_max=2) == ["c", "d"]
+
+
+def test_generic_shell_parallel_cmds_keep_order_and_fail_fast(monkeypatch, tmp_path: Path) -> None:
+    import threading
+
+    from archmind import runner
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_shell(command: str, cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
+        if command in {"a", "b"}:
+            barrier.wait()
+        return CommandResult(
+            cmd=["sh", "-c", command], cwd=cwd, exit_code=1 if command == "b" else 0,
+            duration_s=0.0, stdout=command, stderr="",
+        )
+
+    monkeypatch.setattr(runner, "run_shell_capture", fake_shell)
+
+    def make_config(fail_fast: bool) -> RunConfig:
+        return _make_config(
+            tmp_path,
+            profile="generic-shell",
+            cmds=["a", "b", "c"],
+            parallel_cmds=True,
+            fail_fast=fail_fast,
+        )
+
+    steps = runner.run_generic_shell_profile(make_config(fail_fast=False))
+    assert [step.name for step in steps] == ["cmd-1", "cmd-2", "cmd-3"]
+    assert [step.status for step in steps] == ["OK", "FAIL", "OK"]
+
+    barrier.reset()
+    steps = runner.run_generic_shell_profile(make_config(fail_fast=True))
+    assert [step.name for step in steps][:2] == ["cmd-1", "cmd-2"]
+    assert steps[1].status == "FAIL"
+
+
+def test_generic_shell_sequential_cmds_honour_fail_fast(tmp_path: Path) -> None:
+    from archmind.runner import run_generic_shell_profile
+
+    cmds = ["true", "exit 2", "true"]
+
+    steps = run_generic_shell_profile(_make_config(tmp_path, profile="generic-shell", cmds=cmds))
+    assert [step.status for step in steps] == ["OK", "FAIL"]
+
+    steps = run_generic_shell_profile(_make_config(tmp_path, profile="generic-shell", cmds=cmds, fail_fast=False))
+    assert [step.status for step in steps] == ["OK", "FAIL", "OK"]
+
+
+def test_run_result_files_skip_rewrite_when_unchanged(tmp_path: Path) -> None:
+    from archmind.runner import _write_run_result_files
+
+    json_path, txt_path = _write_run_result_files(tmp_path, "SUCCESS", "generic-shell", "20240101_000000", [], [], [], None)
+    first = (json_path.stat().st_ino, txt_path.stat().st_ino)
+
+    _write_run_result_files(tmp_path, "SUCCESS", "generic-shell", "20240101_000000", [], [], [], None)
+    assert (json_path.stat().st_ino, txt_path.stat().st_ino) == first
+
+    _write_run_result_files(tmp_path, "FAIL", "generic-shell", "20240101_000001", [], ["boom"], [], "boom")
+    assert json.loads(json_path.read_text(encoding="utf-8"))["status"] == "FAIL"
+    assert json_path.stat().st_ino != first[0]
+    assert not list((tmp_path / ".archmind").glob("*.tmp"))
+
+
+def test_run_cmd_capture_timeout_terminates_before_kill(tmp_path: Path) -> None:
+    import sys
+
+    from archmind import runner
+
+    graceful = (
+        "import signal, sys, time\n"
+        "def bye(*_):\n"
+        "    print('cleanup done', flush=True)\n"
+        "    sys.exit(0)\n"
+        "signal.signal(signal.SIGTERM, bye)\n"
+        "print('started', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    result = runner.run_cmd_capture([sys.executable, "-c", graceful], tmp_path, 1)
+    assert result.timed_out is True
+    assert result.exit_code == 124
+    assert "cleanup done" in result.stdout
+
+    stubborn = (
+        "import signal, time\n"
+        "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        "print('started', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    result = runner.run_cmd_capture([sys.executable, "-c", stubborn], tmp_path, 1)
+    assert result.timed_out is True
+    assert "started" in result.stdout
+    assert result.duration_s < 1 + runner._TERMINATE_GRACE_S + 5
+
+
+def test_run_pipeline_unknown_profile_is_skipped(tmp_path: Path) -> None:
+    from archmind.runner import run_pipeline
+
+    config = _make_config(tmp_path, profile="nope")
+
+    result = run_pipeline(config)
+
+    assert result.overall_exit_code == 0
+    assert [step.name for step in result.profile_steps] == ["profile"]
+    assert result.profile_steps[0].stdout == "Unknown profile: nope"
+
+
+def test_stream_log_lines_inline_and_streamed_paths_match(monkeypatch, tmp_path: Path) -> None:
+    from archmind import runner
+
+    lines = ["== Run Log ==", "status: FAIL", "STDOUT:", "out 한글\n", "STDERR:", "err  \n", "", "  "]
+    expected = ("\n".join(lines).strip() + "\n").encode("utf-8")
+
+    runner._stream_log_lines(tmp_path / "inline.log", lines)
+    monkeypatch.setattr(runner, "_LOG_INLINE_LIMIT", 0)
+    runner._stream_log_lines(tmp_path / "streamed.log", lines)
+
+    assert (tmp_path / "inline.log").read_bytes() == expected
+    assert (tmp_path / "streamed.log").read_bytes() == expected
+
+
+def test_failure_prompt_can_be_disabled(tmp_path: Path) -> None:
+    from archmind.runner import run_pipeline
+
+    def make_config(emit: bool) -> RunConfig:
+        return _make_config(tmp_path, profile="generic-shell", cmds=["exit 3"], emit_failure_prompt=emit)
+
+    result = run_pipeline(make_config(emit=False))
+    assert result.overall_exit_code == 1
+    assert not list((tmp_path / ".archmind" / "run_logs").glob("*.prompt.md"))
+
+    run_pipeline(make_config(emit=True))
+    assert _find_prompt(tmp_path).exists()
+
+
+def test_large_run_log_is_written_before_result_returns(monkeypatch, tmp_path: Path) -> None:
+    from archmind import runner
+
+    monkeypatch.setattr(runner, "_LOG_INLINE_LIMIT", 0)
+    config = _make_config(tmp_path, json_summary=True, profile="generic-shell", cmds=["echo streamed-log-marker"])
+
+    result = runner.run_pipeline(config)
+
+    assert result.overall_exit_code == 0
+    assert "streamed-log-marker" in result.log_path.read_text(encoding="utf-8")
+    assert result.json_summary_path is not None and result.json_summary_path.exists()
+
+
+def test_write_logs_disabled_returns_result_without_files(tmp_path: Path) -> None:
+    from archmind.runner import run_pipeline
+
+    config = _make_config(tmp_path, json_summary=True, profile="generic-shell", cmds=["exit 3"], write_logs=False)
+
+    result = run_pipeline(config)
+
+    assert result.overall_exit_code == 1
+    assert result.log_path is None
+    assert result.summary_path is None
+    assert result.profile_steps is not None and result.profile_steps[0].status == "FAIL"
+    assert not (tmp_path / ".archmind").exists()
+
+
+def test_write_logs_disabled_result_feeds_failure_consumers(tmp_path: Path) -> None:
+    from archmind.fixer import read_tail
+    from archmind.runner import run_pipeline, write_failure_prompt
+
+    config = _make_config(tmp_path, profile="generic-shell", cmds=["exit 3"], write_logs=False)
+
+    result = run_pipeline(config)
+
+    assert read_tail(result.log_path) == []
+    assert write_failure_prompt(config, result) is None
+    assert not (tmp_path / ".archmind").exists()
+
+
+def test_write_logs_disabled_skips_frontend_live_log(tmp_path: Path, monkeypatch, capsys) -> None:
+    from archmind.runner import print_run_result, run_pipeline
+
+    _write_frontend_package(tmp_path)
+    monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
+
+    def fake_run_cmd_capture(cmd: list[str], cwd: Path, timeout_s: int, **kwargs) -> CommandResult:
+        assert kwargs.get("log_fd") is None
+        return CommandResult(cmd=cmd, cwd=cwd, exit_code=0, duration_s=0.01, stdout="ok", stderr="")
+
+    monkeypatch.setattr("archmind.runner.run_cmd_capture", fake_run_cmd_capture)
+    config = _make_config(tmp_path, run_all=True, no_install=False, json_summary=True, write_logs=False)
+
+    result = run_pipeline(config)
+
+    assert [step.name for step in result.frontend.steps] == ["install", "lint", "test", "build"]
+    assert result.frontend.output_log is None
+    assert result.log_path is None
+    assert not (tmp_path / ".archmind").exists()
+
+    print_run_result(result)
+    assert "Log:" not in capsys.readouterr().out
+
+
+def test_failure_prompt_repro_command_keeps_cmd_quoting(tmp_path: Path) -> None:
+    exit_code = main(["run", "--path", str(tmp_path), "--profile", "generic-shell", "--cmd", "exit 3"])
+    assert exit_code == 1
+
+    prompt_text = _find_prompt(tmp_path).read_text(encoding="utf-8")
+    assert "--cmd 'exit 3'" in prompt_text
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from archmind.fixer import apply_plan, build_plan, build_diagnosis
+from archmind.fixer import _extract_failure_details, apply_plan, build_plan, build_diagnosis, read_tail
 
 
 def _write_project(tmp_path: Path) -> Path:
@@ -56,3 +56,24 @@ def test_dry_run_does_not_modify_files(tmp_path: Path) -> None:
     assert diffs
 
     assert target.read_text(encoding="utf-8") == original
+
+
+def test_read_tail_keeps_last_lines_across_newline_styles(tmp_path: Path) -> None:
+    log = tmp_path / "run.log"
+    log.write_bytes(b"one\r\ntwo\rthree\nfour\x0cfive\nsix")
+
+    assert read_tail(log, n=4) == ["three", "four", "five", "six"]
+    assert read_tail(log, n=120) == ["one", "two", "three", "four", "five", "six"]
+    assert read_tail(tmp_path / "missing.log") == []
+
+
+def test_extract_failure_details_takes_first_failed_line_start() -> None:
+    text = "collected 2 items\r\nxFAILED not/this.py\r\nFAILED tests/test_api.py::test_get - assert 1 == 2\r\nFAILED tests/test_b.py::t\r\n"
+
+    details = _extract_failure_details(text)
+
+    assert details["test_name"] == "tests/test_api.py::test_get"
+    assert details["file_path"] == "tests/test_api.py"
+    assert _extract_failure_details("src/App.tsx\nfrontend/src/App.tsx:3:1 error", "frontend_build")["file_path"] == (
+        "frontend/src/App.tsx"
+    )
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+
 from archmind.generator import GenerateOptions, generate_project, validate_generated_project_structure
 
 
@@ -87,3 +90,19 @@ def test_validate_generated_project_structure_for_data_tool_reports_template_spe
     check = validate_generated_project_structure(project, template_name="data-tool")
     assert check["ok"] is False
     assert str(check.get("reason", "")).startswith("invalid data-tool structure:")
+
+
+def test_generate_project_writes_spec_snapshot_before_scaffolding(tmp_path: Path, monkeypatch) -> None:
+    def broken_scaffolds(project_dir: Path, spec: dict) -> list[str]:  # type: ignore[type-arg]
+        raise RuntimeError("scaffold failed")
+
+    monkeypatch.setattr("archmind.generator._apply_spec_scaffolds", broken_scaffolds)
+    opt = GenerateOptions(out=tmp_path, force=False, name="broken_demo", template="nextjs")
+
+    with pytest.raises(RuntimeError, match="scaffold failed"):
+        generate_project("simple nextjs counter dashboard", opt)
+
+    project_dir = (tmp_path / "broken_demo").resolve()
+    snapshot = json.loads((project_dir / "archmind_spec.json").read_text(encoding="utf-8"))
+    assert snapshot["project_name"] == "broken_demo"
+    assert not (project_dir / "archmind_spec.json.tmp").exists()
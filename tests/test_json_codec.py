@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+
+import archmind.json_codec as json_codec
+from archmind.json_codec import dumps_compact, dumps_indented
+
+
+def test_dumps_indented_matches_stdlib_layout() -> None:
+    payload = {"status": "FAIL", "steps": {"run": {"exit_code": 1}}, "summary": ["한글", None]}
+
+    out = dumps_indented(payload)
+
+    assert isinstance(out, bytes)
+    assert json.loads(out.decode("utf-8")) == payload
+    assert out.decode("utf-8") == json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def test_dumps_indented_falls_back_without_orjson(monkeypatch) -> None:
+    monkeypatch.setattr(json_codec, "orjson", None)
+    payload = {"a": [1, 2], "b": {"c": "d"}}
+
+    assert dumps_indented(payload) == json.dumps(payload, indent=2).encode("utf-8")
+
+
+def test_dumps_compact_has_no_whitespace(monkeypatch) -> None:
+    payload = {"a": [1, 2], "b": {"c": "한글"}}
+
+    assert dumps_compact(payload) == '{"a":[1,2],"b":{"c":"한글"}}'.encode("utf-8")
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert dumps_compact(payload) == '{"a":[1,2],"b":{"c":"한글"}}'.encode("utf-8")
+
+
+def test_loads_accepts_bytes_with_and_without_orjson(monkeypatch) -> None:
+    raw = '{"scripts": {"lint": "eslint ."}, "name": "데모"}'.encode("utf-8")
+
+    assert json_codec.loads(raw) == {"scripts": {"lint": "eslint ."}, "name": "데모"}
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.loads(raw) == {"scripts": {"lint": "eslint ."}, "name": "데모"}
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from archmind.patcher import apply_unified_diff
+
+
+def test_apply_unified_diff_applies_multiple_hunks(tmp_path: Path) -> None:
+    target = tmp_path / "app.py"
+    target.write_text("a\nb\nc\nd\ne\nf\n", encoding="utf-8")
+    diff = (
+        "--- a/app.py\n"
+        "+++ b/app.py\n"
+        "@@ -2,2 +2,2 @@\n"
+        " b\n"
+        "-c\n"
+        "+C\n"
+        "@@ -5,1 +5,2 @@\n"
+        " e\n"
+        "+E2\n"
+    )
+
+    changed = apply_unified_diff(tmp_path, diff)
+
+    assert changed == [target.resolve()]
+    assert target.read_text(encoding="utf-8") == "a\nb\nC\nd\ne\nE2\nf\n"
+    backups = list((tmp_path / ".archmind" / "patch_backups").rglob("app.py"))
+    assert len(backups) == 1
+    assert backups[0].read_text(encoding="utf-8") == "a\nb\nc\nd\ne\nf\n"
+
+
+def test_apply_unified_diff_creates_new_file(tmp_path: Path) -> None:
+    diff = "--- /dev/null\n+++ b/pkg/new.txt\n@@ -0,0 +1,2 @@\n+x\n+y\n"
+
+    apply_unified_diff(tmp_path, diff)
+
+    assert (tmp_path / "pkg" / "new.txt").read_text(encoding="utf-8") == "x\ny\n"
+
+
+@pytest.mark.parametrize(
+    ("hunk", "message"),
+    [
+        ("@@ -2,2 +2,2 @@\n x\n-c\n+C\n", "Patch context mismatch"),
+        ("@@ -2,2 +2,2 @@\n b\n-x\n+C\n", "Patch deletion mismatch"),
+        ("@@ -20,1 +20,1 @@\n-x\n+C\n", "past end of file"),
+    ],
+)
+def test_apply_unified_diff_rejects_mismatched_hunks(tmp_path: Path, hunk: str, message: str) -> None:
+    target = tmp_path / "app.py"
+    target.write_text("a\nb\nc\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match=message):
+        apply_unified_diff(tmp_path, "--- a/app.py\n+++ b/app.py\n" + hunk)
+
+    assert target.read_text(encoding="utf-8") == "a\nb\nc\n"
+
+
+def test_apply_unified_diff_rejects_escaping_paths(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsafe patch path"):
+        apply_unified_diff(tmp_path, "--- a/../x.txt\n+++ b/../x.txt\n@@ -0,0 +1 @@\n+x\n")
@@ -49,6 +49,10 @@ def test_pipeline_writes_result_on_failure(tmp_path: Path) -> None:
     assert result_path.exists()
     payload = json.loads(result_path.read_text(encoding="utf-8"))
     assert payload["status"] in {"FAIL", "PARTIAL"}
+    summaries = sorted((tmp_path / ".archmind" / "run_logs").glob("run_*.summary.txt"))
+    assert summaries
+    assert "[FAIL] 마지막 run 요약:" in result.stdout
+    assert summaries[-1].read_text(encoding="utf-8").strip() in result.stdout
 
 
 def test_pipeline_writes_result_on_success(tmp_path: Path) -> None:
@@ -90,3 +94,26 @@ def test_pipeline_backend_success_frontend_skip(tmp_path: Path, monkeypatch) ->
     payload = json.loads(result_path.read_text(encoding="utf-8"))
     run_detail = payload["steps"]["run_before_fix"]["detail"]
     assert run_detail["frontend_status"] == "SKIPPED"
+
+
+def test_compute_status_table_matches_decision_ladder() -> None:
+    from archmind.pipeline import compute_status
+
+    def expected(run_before_ok, fix_exit, run_after_ok, apply):  # type: ignore[no-untyped-def]
+        if run_before_ok:
+            return "SUCCESS"
+        if fix_exit is None:
+            return "FAIL"
+        if fix_exit != 0:
+            return "PARTIAL" if not apply else "FAIL"
+        if run_after_ok:
+            return "SUCCESS"
+        return "FAIL"
+
+    for run_before_ok in (False, True):
+        for fix_exit in (None, 0, 1, 2):
+            for run_after_ok in (None, False, True):
+                for apply in (False, True):
+                    assert compute_status(run_before_ok, fix_exit, run_after_ok, apply) == expected(
+                        run_before_ok, fix_exit, run_after_ok, apply
+                    )
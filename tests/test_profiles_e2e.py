@@ -113,3 +113,116 @@ def test_e2e_generic_shell_failure_summary(tmp_path: Path) -> None:
     assert payload["profile"] == "generic-shell"
     failure_summary = payload.get("failure_summary") or []
     assert len(failure_summary) > 0
+
+
+def test_e2e_node_vite_runs_check_scripts_concurrently(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    tmp_path.joinpath("package.json").write_text(
+        '{"name": "demo", "private": true, "scripts": {"lint": "x", "typecheck": "x", "build": "x"}}',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
+    barrier = threading.Barrier(2, timeout=5)
+    commands: list[str] = []
+
+    def fake_run_shell_capture(command: str, cwd: Path, timeout_s: int, **_kwargs) -> CommandResult:
+        if command in ("npm run lint", "npm run typecheck"):
+            barrier.wait()
+        commands.append(command)
+        return CommandResult(cmd=["sh", "-c", command], cwd=cwd, exit_code=0, duration_s=0.01, stdout="", stderr="")
+
+    monkeypatch.setattr("archmind.runner.run_shell_capture", fake_run_shell_capture)
+
+    exit_code = main(["run", "--path", str(tmp_path), "--profile", "node-vite", "--no-install"])
+    assert exit_code == 0
+
+    payload = _read_result_payload(tmp_path)
+    assert [step["name"] for step in payload["steps"]] == ["scripts", "lint", "typecheck", "build"]
+    assert payload["steps"][0]["status"] == "SKIP"
+    assert commands[-1] == "npm run build"
+
+    # a failing lint stops the run without waiting for the checks still running next to it
+    import time
+
+    tmp_path.joinpath("package.json").write_text(
+        '{"name": "demo", "private": true, "scripts": {"lint": "x", "typecheck": "x", "test": "x", "build": "x"}}',
+        encoding="utf-8",
+    )
+    commands.clear()
+    cancelled: list[bool] = []
+    all_started = threading.Barrier(3, timeout=5)
+
+    def failing_lint_shell_capture(command: str, cwd: Path, timeout_s: int, **kwargs) -> CommandResult:
+        commands.append(command)
+        all_started.wait()
+        if command == "npm run lint":
+            return CommandResult(cmd=["sh", "-c", command], cwd=cwd, exit_code=1, duration_s=0.01, stdout="", stderr="x")
+        cancelled.append(kwargs["cancel"].wait(timeout=10))
+        return CommandResult(cmd=["sh", "-c", command], cwd=cwd, exit_code=-15, duration_s=0.01, stdout="", stderr="")
+
+    monkeypatch.setattr("archmind.runner.run_shell_capture", failing_lint_shell_capture)
+
+    started = time.monotonic()
+    exit_code = main(["run", "--path", str(tmp_path), "--profile", "node-vite", "--no-install"])
+    assert time.monotonic() - started < 5
+    assert exit_code == 1
+
+    payload = _read_result_payload(tmp_path)
+    assert [step["name"] for step in payload["steps"]] == ["lint"]
+    assert cancelled == [True, True]
+    assert "npm run build" not in commands
+
+
+def test_e2e_node_vite_reports_missing_scripts_once(tmp_path: Path, monkeypatch) -> None:
+    tmp_path.joinpath("package.json").write_text('{"name": "demo", "private": true}', encoding="utf-8")
+    monkeypatch.setattr("archmind.runner.shutil.which", lambda _: "/usr/bin/fake")
+
+    def fail_run_shell_capture(command: str, cwd: Path, timeout_s: int) -> CommandResult:
+        raise AssertionError(f"unexpected command: {command}")
+
+    monkeypatch.setattr("archmind.runner.run_shell_capture", fail_run_shell_capture)
+
+    exit_code = main(["run", "--path", str(tmp_path), "--profile", "node-vite", "--no-install"])
+    assert exit_code == 0
+
+    payload = _read_result_payload(tmp_path)
+    assert payload["status"] == "SKIP"
+    assert [step["name"] for step in payload["steps"]] == ["scripts"]
+    assert payload["reason"] == "script not found: lint, typecheck, test, build"
+
+
+def test_e2e_generic_shell_json_summary_keeps_utf8_text(tmp_path: Path) -> None:
+    exit_code = main(["run", "--path", str(tmp_path), "--profile", "generic", "--cmd", "echo 완료", "--json-summary"])
+    assert exit_code == 0
+
+    summary_json = next((tmp_path / ".archmind" / "run_logs").glob("run_*.summary.json"))
+    raw = summary_json.read_bytes()
+    assert "echo 완료".encode("utf-8") in raw
+    assert json.loads(raw)["steps"][0]["cmd"] == "echo 완료"
+    assert _read_result_payload(tmp_path)["steps"][0]["cmd"] == "echo 완료"
+
+
+def test_e2e_generic_shell_json_compact_summary(tmp_path: Path) -> None:
+    exit_code = main(
+        ["run", "--path", str(tmp_path), "--profile", "generic", "--cmd", "true", "--json-summary", "--json-compact"]
+    )
+    assert exit_code == 0
+
+    summary_json = next((tmp_path / ".archmind" / "run_logs").glob("run_*.summary.json"))
+    raw = summary_json.read_text(encoding="utf-8")
+    assert "\n" not in raw and ": " not in raw
+    assert json.loads(raw)["meta"]["profile"] == "generic-shell"
+
+
+def test_e2e_generic_shell_no_fail_fast_runs_every_cmd(tmp_path: Path) -> None:
+    exit_code = main(
+        [
+            "run", "--path", str(tmp_path), "--profile", "generic",
+            "--cmd", "exit 3", "--cmd", "true", "--parallel-cmds", "--no-fail-fast",
+        ]
+    )
+    assert exit_code == 1
+
+    steps = _read_result_payload(tmp_path)["steps"]
+    assert [step["status"] for step in steps] == ["FAIL", "OK"]
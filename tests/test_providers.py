@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json as jsonlib
 from typing import Any
 
 import pytest
@@ -11,9 +12,23 @@ from archmind.providers.router import ProviderRouter, build_provider_router
 
 
 class _DummyResponse:
-    def __init__(self, *, payload: dict[str, Any], status_code: int = 200) -> None:
+    def __init__(
+        self,
+        *,
+        payload: dict[str, Any],
+        status_code: int = 200,
+        chunks: list[dict[str, Any]] | None = None,
+    ) -> None:
         self._payload = payload
         self.status_code = status_code
+        self._chunks = chunks if chunks is not None else [payload]
+        self.closed = False
+
+    def __enter__(self) -> "_DummyResponse":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.closed = True
 
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
@@ -22,14 +37,20 @@ class _DummyResponse:
     def json(self) -> dict[str, Any]:
         return self._payload
 
+    def iter_lines(self):  # type: ignore[no-untyped-def]
+        for chunk in self._chunks:
+            yield jsonlib.dumps(chunk).encode("utf-8")
+            yield b""
+
 
 def test_local_provider_success(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, *, json: dict[str, Any], timeout: int):  # type: ignore[no-untyped-def]
+    def fake_post(url: str, *, json: dict[str, Any], timeout: int, stream: bool):  # type: ignore[no-untyped-def]
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
+        captured["stream"] = stream
         return _DummyResponse(payload={"message": {"content": "local-ok"}})
 
     monkeypatch.setattr("archmind.providers.local_provider.requests.post", fake_post)
@@ -40,9 +61,80 @@ def test_local_provider_success(monkeypatch) -> None:
     assert captured["url"].endswith("/api/chat")
     assert captured["json"]["model"] == "llama3:latest"
     assert captured["json"]["format"] == "json"
+    assert captured["json"]["stream"] is True
+    assert captured["stream"] is True
     assert captured["timeout"] == 12
 
 
+def test_local_provider_sends_keep_alive(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, *, json: dict[str, Any], timeout: int, stream: bool = False):  # type: ignore[no-untyped-def]
+        captured.setdefault("calls", []).append((url, json))
+        return _DummyResponse(payload={"message": {"content": "ok"}})
+
+    monkeypatch.setenv("ARCHMIND_OLLAMA_KEEPALIVE", "30m")
+    monkeypatch.setattr("archmind.providers.local_provider.requests.post", fake_post)
+    provider = LocalProvider(base_url="http://127.0.0.1:11434", model="llama3:latest")
+
+    assert provider.generate("hello") == "ok"
+    ((chat_url, chat_json),) = captured["calls"]
+    assert chat_url.endswith("/api/chat")
+    assert chat_json["keep_alive"] == "30m"
+
+
+def test_local_provider_joins_streamed_chunks(monkeypatch) -> None:
+    chunks = [
+        {"message": {"role": "assistant", "content": '{"a": '}, "done": False},
+        {"message": {"role": "assistant", "content": "1}"}, "done": False},
+        {"message": {"role": "assistant", "content": ""}, "done": True},
+    ]
+
+    def fake_post(*_a, **_k):  # type: ignore[no-untyped-def]
+        return _DummyResponse(payload={}, chunks=chunks)
+
+    monkeypatch.setattr("archmind.providers.local_provider.requests.post", fake_post)
+    provider = LocalProvider(base_url="http://127.0.0.1:11434", model="llama3:latest")
+
+    assert provider.generate("hello", format_json=True) == '{"a": 1}'
+
+
+def test_local_provider_raises_on_mid_stream_error(monkeypatch) -> None:
+    chunks = [
+        {"message": {"role": "assistant", "content": "partial"}, "done": False},
+        {"error": "model runner has unexpectedly stopped"},
+    ]
+
+    response = _DummyResponse(payload={}, chunks=chunks)
+
+    def fake_post(*_a, **_k):  # type: ignore[no-untyped-def]
+        return response
+
+    monkeypatch.setattr("archmind.providers.local_provider.requests.post", fake_post)
+    provider = LocalProvider(base_url="http://127.0.0.1:11434", model="llama3:latest")
+
+    with pytest.raises(ProviderError, match="model runner has unexpectedly stopped"):
+        provider.generate("hello")
+    assert response.closed is True
+
+
+def test_local_provider_caps_total_stream_time(monkeypatch) -> None:
+    chunks = [{"message": {"role": "assistant", "content": "again "}, "done": False}] * 50
+    clock = iter(range(0, 1000, 5))
+    response = _DummyResponse(payload={}, chunks=chunks)
+
+    def fake_post(*_a, **_k):  # type: ignore[no-untyped-def]
+        return response
+
+    monkeypatch.setattr("archmind.providers.local_provider.requests.post", fake_post)
+    monkeypatch.setattr("archmind.providers.local_provider.time.monotonic", lambda: next(clock))
+    provider = LocalProvider(base_url="http://127.0.0.1:11434", model="llama3:latest", timeout_s=12)
+
+    with pytest.raises(ProviderError, match="timed out after 12s"):
+        provider.generate("hello")
+    assert response.closed is True
+
+
 def test_local_provider_failure(monkeypatch) -> None:
     def fake_post(*_a, **_k):  # type: ignore[no-untyped-def]
         raise RuntimeError("connect failed")